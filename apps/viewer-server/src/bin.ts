@@ -68,8 +68,6 @@ export async function main(argv: string[]): Promise<void> {
   // (and before any long-running processes start).
   loadDotenvFromCwd();
 
-  const { startServer } = await import('./server.js');
-
   const { values } = parseArgs({
     args: argv,
     options: {
@@ -91,6 +89,9 @@ export async function main(argv: string[]): Promise<void> {
   const port = Number(values.port ?? 8080);
   if (!Number.isInteger(port) || port <= 0) throw new Error(`invalid port: ${values.port}`);
 
+  // Deferred until needed: --help and argument errors shouldn't pay for
+  // loading Fastify, SQLite and the rest of the server module graph.
+  const { startServer } = await import('./server.js');
   await startServer({
     host,
     port,
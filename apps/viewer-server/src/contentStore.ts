@@ -4,13 +4,14 @@ import path from 'node:path';
 import {
   countPromptsInDb,
   countWorkflowsInDb,
-  listPromptsFromDb,
-  listWorkflowsFromDb,
+  listPromptIdsFromDb,
+  listWorkflowNamesFromDb,
   readPromptFromDb,
   readWorkflowFromDb,
   upsertPromptInDb,
   upsertWorkflowInDb,
 } from './sqliteStorage.js';
+import { writeTextAtomic } from './textAtomic.js';
 
 async function walkMarkdownFiles(dir: string, prefix = ''): Promise<readonly { id: string; absPath: string }[]> {
   const entries = await fs.readdir(dir, { withFileTypes: true }).catch(() => []);
@@ -52,7 +53,7 @@ export async function seedPromptsFromFilesIfNeeded(dataDir: string, promptsDir:
 }
 
 export async function listPromptIdsFromStore(dataDir: string): Promise<string[]> {
-  return listPromptsFromDb(dataDir).map((p) => p.id);
+  return listPromptIdsFromDb(dataDir);
 }
 
 export async function readPromptFromStore(dataDir: string, id: string): Promise<string | null> {
@@ -69,8 +70,7 @@ export async function writePromptToStore(params: {
   const { dataDir, promptsDir, id, content } = params;
   upsertPromptInDb(dataDir, id, content);
   const promptPath = path.resolve(promptsDir, id);
-  await fs.mkdir(path.dirname(promptPath), { recursive: true });
-  await fs.writeFile(promptPath, content, 'utf-8');
+  await writeTextAtomic(promptPath, content);
 }
 
 export async function cachePromptInStore(dataDir: string, id: string, content: string): Promise<void> {
@@ -103,7 +103,7 @@ export async function seedWorkflowsFromFilesIfNeeded(dataDir: string, workflowsD
 }
 
 export async function listWorkflowNamesFromStore(dataDir: string): Promise<string[]> {
-  return listWorkflowsFromDb(dataDir).map((wf) => wf.name);
+  return listWorkflowNamesFromDb(dataDir);
 }
 
 export async function readWorkflowYamlFromStore(dataDir: string, name: string): Promise<string | null> {
@@ -122,8 +122,7 @@ export async function writeWorkflowToStore(params: {
   const existing = await fs.lstat(workflowPath).catch(() => null);
   if (existing?.isSymbolicLink()) throw new Error('Refusing to write to a symlink.');
   upsertWorkflowInDb(dataDir, name, yaml);
-  await fs.mkdir(path.dirname(workflowPath), { recursive: true });
-  await fs.writeFile(workflowPath, yaml, 'utf-8');
+  await writeTextAtomic(workflowPath, yaml);
 }
 
 export async function cacheWorkflowInStore(dataDir: string, name: string, yaml: string): Promise<void> {
@@ -0,0 +1,95 @@
+import { describe, expect, it } from 'vitest';
+
+import { EventHub, MAX_CLIENT_BUFFERED_BYTES } from './eventHub.js';
+
+describe('EventHub', () => {
+  it('drops an SSE client whose socket buffer exceeds the limit', () => {
+    const writes: string[] = [];
+    let destroyed = false;
+    const res = {
+      writableLength: 0,
+      write(chunk: string) {
+        writes.push(chunk);
+        return true;
+      },
+      destroy() {
+        destroyed = true;
+      },
+    };
+
+    const hub = new EventHub();
+    const id = hub.addSseClient(res);
+
+    hub.broadcast('logs', { lines: ['a'] });
+    expect(writes).toEqual(['event: logs\ndata: {"lines":["a"]}\n\n']);
+
+    res.writableLength = MAX_CLIENT_BUFFERED_BYTES + 1;
+    hub.broadcast('logs', { lines: ['b'] });
+    expect(writes).toHaveLength(1);
+    expect(destroyed).toBe(true);
+
+    res.writableLength = 0;
+    hub.sendTo(id, 'logs', { lines: ['c'] });
+    expect(writes).toHaveLength(1);
+  });
+
+  it('closes a WebSocket client that stops draining', () => {
+    const sent: string[] = [];
+    let closed = false;
+    const socket = {
+      bufferedAmount: MAX_CLIENT_BUFFERED_BYTES + 1,
+      send(data: string) {
+        sent.push(data);
+      },
+      close() {
+        closed = true;
+      },
+    };
+
+    const hub = new EventHub();
+    hub.addWsClient(socket);
+    hub.broadcast('state', {});
+
+    expect(sent).toEqual([]);
+    expect(closed).toBe(true);
+  });
+
+  it('terminates a stalled WebSocket client instead of closing it gracefully', () => {
+    let closed = false;
+    let terminated = false;
+    const socket = {
+      bufferedAmount: MAX_CLIENT_BUFFERED_BYTES + 1,
+      send() {
+        throw new Error('should not send to a stalled client');
+      },
+      close() {
+        closed = true;
+      },
+      terminate() {
+        terminated = true;
+      },
+    };
+
+    const hub = new EventHub();
+    hub.addWsClient(socket);
+    hub.broadcast('state', {});
+    hub.broadcast('state', {});
+
+    expect(terminated).toBe(true);
+    expect(closed).toBe(false);
+  });
+
+  it('sends WebSocket frames identical to stringifying the event envelope', () => {
+    const sent: string[] = [];
+    const hub = new EventHub();
+    hub.addWsClient({ send: (data: string) => sent.push(data) });
+
+    hub.broadcast('logs', { lines: ['a', 'b'] });
+    hub.broadcast('ping', undefined);
+
+    expect(sent).toEqual([
+      JSON.stringify({ event: 'logs', data: { lines: ['a', 'b'] } }),
+      JSON.stringify({ event: 'ping', data: undefined }),
+    ]);
+  });
+});
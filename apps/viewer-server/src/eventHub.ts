@@ -1,18 +1,37 @@
-import type { ServerResponse } from 'node:http';
+/** Receives an event with its data already serialized by JSON.stringify. */
+type SendFn = (event: string, json: string | undefined) => void;
+type SseLike = Readonly<{ writableLength: number; write(chunk: string): unknown; destroy(): void }>;
+type WsLike = Readonly<{ send(data: string): void; bufferedAmount?: number; close?(): void; terminate?(): void }>;
 
-type SendFn = (event: string, data: unknown) => void;
-type WsLike = Readonly<{ send(data: string): void }>;
+/**
+ * Bytes a single client may have queued in its socket before it is treated as
+ * a stalled consumer and disconnected. Browsers reconnect on their own and get
+ * a fresh snapshot, which is cheaper than buffering an unbounded backlog.
+ */
+export const MAX_CLIENT_BUFFERED_BYTES = 8 * 1024 * 1024;
+
+function serialize(data: unknown): string | undefined | null {
+  try {
+    return JSON.stringify(data);
+  } catch {
+    // unserializable payloads (cycles, BigInt) are dropped, as before
+    return null;
+  }
+}
 
 export class EventHub {
   private readonly clients = new Map<number, SendFn>();
   private nextId = 1;
 
-  addSseClient(res: ServerResponse): number {
+  addSseClient(res: SseLike): number {
     const id = this.nextId++;
-    this.clients.set(id, (event, data) => {
+    this.clients.set(id, (event, json) => {
+      if (res.writableLength > MAX_CLIENT_BUFFERED_BYTES) {
+        this.dropClient(id, () => res.destroy());
+        return;
+      }
       try {
-        const payload = `event: ${event}\ndata: ${JSON.stringify(data)}\n\n`;
-        res.write(payload);
+        res.write(`event: ${event}\ndata: ${json}\n\n`);
       } catch {
         // ignore; connection cleanup happens on close handlers
       }
@@ -22,9 +41,21 @@ export class EventHub {
 
   addWsClient(socket: WsLike): number {
     const id = this.nextId++;
-    this.clients.set(id, (event, data) => {
+    this.clients.set(id, (event, json) => {
+      if ((socket.bufferedAmount ?? 0) > MAX_CLIENT_BUFFERED_BYTES) {
+        // terminate() tears the socket down immediately; a graceful close() would
+        // queue its close frame behind the backlog the peer is not reading.
+        this.dropClient(id, () => (socket.terminate ? socket.terminate() : socket.close?.()));
+        return;
+      }
       try {
-        socket.send(JSON.stringify({ event, data }));
+        // Same text as JSON.stringify({ event, data }), spliced from the
+        // already-serialized data.
+        socket.send(
+          json === undefined
+            ? JSON.stringify({ event })
+            : `{"event":${JSON.stringify(event)},"data":${json}}`,
+        );
       } catch {
         // ignore; connection cleanup happens on close handlers
       }
@@ -32,6 +63,10 @@ export class EventHub {
     return id;
   }
 
+  get clientCount(): number {
+    return this.clients.size;
+  }
+
   removeClient(id: number): void {
     this.clients.delete(id);
   }
@@ -39,16 +74,32 @@ export class EventHub {
   sendTo(id: number, event: string, data: unknown): void {
     const send = this.clients.get(id);
     if (!send) return;
-    send(event, data);
+    const json = serialize(data);
+    if (json === null) return;
+    send(event, json);
   }
 
   broadcast(event: string, data: unknown): void {
+    if (this.clients.size === 0) return;
+    // Serialize once per broadcast rather than once per client; log batches
+    // can be large and every client receives the same bytes.
+    const json = serialize(data);
+    if (json === null) return;
     for (const send of this.clients.values()) {
       try {
-        send(event, data);
+        send(event, json);
       } catch {
         // ignore; connection cleanup happens on close handlers
       }
     }
   }
+
+  private dropClient(id: number, close: () => void): void {
+    this.clients.delete(id);
+    try {
+      close();
+    } catch {
+      // ignore; the socket is already being torn down
+    }
+  }
 }
@@ -0,0 +1,35 @@
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+
+import { describe, expect, it } from 'vitest';
+
+import { readIssueJson, readIssueJsonShared, writeIssueJson } from './issueJson.js';
+
+async function makeTempDir(prefix: string): Promise<string> {
+  return fs.mkdtemp(path.join(os.tmpdir(), prefix));
+}
+
+describe('readIssueJsonShared', () => {
+  it('returns the same object until the stored issue changes', async () => {
+    const dataDir = await makeTempDir('jeeves-issue-json-shared-');
+    const stateDir = path.join(dataDir, 'issues', 'acme', 'rocket', '7');
+    await fs.mkdir(stateDir, { recursive: true });
+
+    await writeIssueJson(stateDir, { repo: 'acme/rocket', issue: { number: 7 }, phase: 'design' });
+
+    const first = await readIssueJsonShared(stateDir);
+    const second = await readIssueJsonShared(stateDir);
+    expect(first).not.toBeNull();
+    expect(second).toBe(first);
+    // readIssueJson still hands out a private copy.
+    expect(await readIssueJson(stateDir)).not.toBe(first);
+
+    await writeIssueJson(stateDir, { repo: 'acme/rocket', issue: { number: 7 }, phase: 'implement' });
+
+    const afterWrite = await readIssueJsonShared(stateDir);
+    expect(afterWrite).not.toBe(first);
+    expect(afterWrite?.phase).toBe('implement');
+    expect(first?.phase).toBe('design');
+  });
+});
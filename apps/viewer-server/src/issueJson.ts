@@ -1,6 +1,7 @@
 import {
   listIssuesFromDb,
   readIssueFromDb,
+  readIssuePayloadFromDb,
   readIssueUpdatedAtMs,
   writeIssueToDb,
   type StoredIssueSummary,
@@ -21,8 +22,37 @@ export async function readIssueJson(stateDir: string): Promise<Record<string, un
   return readIssueFromDb(stateDir);
 }
 
-export async function writeIssueJson(stateDir: string, data: Record<string, unknown>): Promise<void> {
-  writeIssueToDb(stateDir, data);
+let sharedIssueJson: { stateDir: string; payload: string; data: Readonly<Record<string, unknown>> | null } | null = null;
+
+/**
+ * Read-only variant of readIssueJson for state snapshots. Reuses the parsed
+ * object while the stored payload text is unchanged, so repeated snapshot
+ * requests skip JSON.parse. The result is shared between callers, hence the
+ * Readonly type; use readIssueJson for a copy that can be modified.
+ */
+export async function readIssueJsonShared(stateDir: string): Promise<Readonly<Record<string, unknown>> | null> {
+  const payload = readIssuePayloadFromDb(stateDir);
+  if (!payload) return null;
+  if (sharedIssueJson && sharedIssueJson.stateDir === stateDir && sharedIssueJson.payload === payload) {
+    return sharedIssueJson.data;
+  }
+  let data: Record<string, unknown> | null = null;
+  try {
+    const parsed = JSON.parse(payload) as unknown;
+    data = parsed && typeof parsed === 'object' && !Array.isArray(parsed) ? (parsed as Record<string, unknown>) : null;
+  } catch {
+    data = null;
+  }
+  sharedIssueJson = { stateDir, payload, data };
+  return data;
+}
+
+export async function writeIssueJson(
+  stateDir: string,
+  data: Record<string, unknown>,
+  options?: { durable?: boolean },
+): Promise<void> {
+  writeIssueToDb(stateDir, data, options);
 }
 
 function toIssueJsonListItem(row: StoredIssueSummary): IssueJsonListItem {
@@ -6,9 +6,12 @@ export async function writeJsonAtomic(filePath: string, data: unknown): Promise<
   await fs.mkdir(dir, { recursive: true });
   const tmp = `${filePath}.tmp`;
   await fs.writeFile(tmp, `${JSON.stringify(data, null, 2)}\n`, 'utf-8');
-  await fs
-    .rm(filePath, { force: true })
-    .catch(() => void 0);
-  await fs.rename(tmp, filePath);
+  // rename() replaces an existing target atomically on POSIX; only fall back to
+  // removing the target first where that fails (e.g. a locked file on Windows).
+  try {
+    await fs.rename(tmp, filePath);
+  } catch {
+    await fs.rm(filePath, { force: true }).catch(() => void 0);
+    await fs.rename(tmp, filePath);
+  }
 }
-
@@ -4,6 +4,7 @@ import { EventEmitter } from 'node:events';
 import fs from 'node:fs/promises';
 import os from 'node:os';
 import path from 'node:path';
+import { PassThrough } from 'node:stream';
 
 import { scheduleReadyTasks, WorkflowEngine, loadWorkflowByName } from '@jeeves/core';
 
@@ -40,8 +41,8 @@ import { installStateDbFsShim } from './testStateDbShim.js';
 function createMockProc(exitCode = 0): ChildProcessWithoutNullStreams {
   const proc = new EventEmitter() as ChildProcessWithoutNullStreams;
   proc.stdin = new EventEmitter() as typeof proc.stdin;
-  proc.stdout = new EventEmitter() as typeof proc.stdout;
-  proc.stderr = new EventEmitter() as typeof proc.stderr;
+  proc.stdout = new PassThrough() as typeof proc.stdout;
+  proc.stderr = new PassThrough() as typeof proc.stderr;
   (proc.stdin as { end: () => void }).end = vi.fn();
   (proc as { exitCode: number | null }).exitCode = null;
   (proc as { pid: number }).pid = 12345;
@@ -65,8 +66,8 @@ function createMockProc(exitCode = 0): ChildProcessWithoutNullStreams {
 function createMockProcWithAsyncSpawnError(errorMessage = 'spawn ENOENT'): ChildProcessWithoutNullStreams {
   const proc = new EventEmitter() as ChildProcessWithoutNullStreams;
   proc.stdin = new EventEmitter() as typeof proc.stdin;
-  proc.stdout = new EventEmitter() as typeof proc.stdout;
-  proc.stderr = new EventEmitter() as typeof proc.stderr;
+  proc.stdout = new PassThrough() as typeof proc.stdout;
+  proc.stderr = new PassThrough() as typeof proc.stderr;
   (proc.stdin as { end: () => void }).end = vi.fn();
   (proc as { exitCode: number | null }).exitCode = null;
   (proc as { pid: number }).pid = undefined as unknown as number; // No valid PID on spawn error
@@ -630,6 +631,71 @@ describe('parallelRunner', () => {
       expect(args[phaseFlag + 1]).toBe('spec_check_layered');
     });
 
+    it('strips terminal escape sequences from worker output', () => {
+      const proc = createMockProc(0);
+      const runner = createRunner({
+        spawn: vi.fn(() => proc) as unknown as typeof import('node:child_process').spawn,
+      });
+
+      const sandbox = {
+        taskId: 'T1',
+        runId: 'run-123',
+        issueNumber: 78,
+        owner: 'o',
+        repo: 'r',
+        stateDir: '/tmp/state/T1',
+        worktreeDir: '/tmp/work/T1',
+        branch: 'issue/78-T1-run-123',
+        repoDir: '/tmp/repo',
+        canonicalBranch: 'issue/78',
+      };
+
+      (
+        runner as unknown as {
+          startWorkerProcess: (...args: unknown[]) => unknown;
+        }
+      ).startWorkerProcess(sandbox, 'implement_task');
+      proc.stdout.emit('data', '\u001b[1;32mPASS\u001b[0m a.test.ts\n\u001b[2Kdone\n');
+
+      expect(logs.join('\n')).toContain('[WORKER T1][STDOUT] PASS a.test.ts\n[WORKER T1][STDOUT] done');
+      expect(logs.some((line) => line.includes('\u001b'))).toBe(false);
+    });
+
+    it('reassembles multi-byte characters split across worker output chunks', async () => {
+      const proc = createMockProc(0);
+      const runner = createRunner({
+        spawn: vi.fn(() => proc) as unknown as typeof import('node:child_process').spawn,
+      });
+
+      const sandbox = {
+        taskId: 'T1',
+        runId: 'run-123',
+        issueNumber: 78,
+        owner: 'o',
+        repo: 'r',
+        stateDir: '/tmp/state/T1',
+        worktreeDir: '/tmp/work/T1',
+        branch: 'issue/78-T1-run-123',
+        repoDir: '/tmp/repo',
+        canonicalBranch: 'issue/78',
+      };
+
+      (
+        runner as unknown as {
+          startWorkerProcess: (...args: unknown[]) => unknown;
+        }
+      ).startWorkerProcess(sandbox, 'implement_task');
+      const bytes = Buffer.from('caf\u00e9 ok\n', 'utf-8');
+      const split = bytes.indexOf(0xc3) + 1;
+      proc.stdout.write(bytes.subarray(0, split));
+      proc.stdout.write(bytes.subarray(split));
+      await new Promise((resolve) => setImmediate(resolve));
+
+      const stdoutLogs = logs.filter((line) => line.startsWith('[WORKER T1][STDOUT]'));
+      expect(stdoutLogs.join('\n')).toContain('\u00e9 ok');
+      expect(stdoutLogs.join('\n')).not.toContain('\ufffd');
+    });
+
     describe('checkForActiveWave', () => {
       it('returns null when no parallel state', async () => {
         await writeJsonAtomic(path.join(stateDir, 'issue.json'), { status: {} });
@@ -4793,8 +4859,8 @@ The task is eligible for retry in the next wave.`,
           // First spawn succeeds - create mock proc
           const proc = new EventEmitter() as ChildProcessWithoutNullStreams;
           proc.stdin = new EventEmitter() as typeof proc.stdin;
-          proc.stdout = new EventEmitter() as typeof proc.stdout;
-          proc.stderr = new EventEmitter() as typeof proc.stderr;
+          proc.stdout = new PassThrough() as typeof proc.stdout;
+          proc.stderr = new PassThrough() as typeof proc.stderr;
           (proc.stdin as { end: () => void }).end = vi.fn();
           (proc as { exitCode: number | null }).exitCode = null;
           (proc as { pid: number }).pid = 12345;
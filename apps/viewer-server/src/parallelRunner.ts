@@ -17,6 +17,7 @@ import path from 'node:path';
 
 import {
   scheduleReadyTasks,
+  stripTerminalControls,
   type TasksFile,
 } from '@jeeves/core';
 
@@ -33,7 +34,7 @@ import {
   validatePathSafeId,
   type WorkerSandbox,
 } from './workerSandbox.js';
-import { readIssueJson, writeIssueJson } from './issueJson.js';
+import { readIssueJson, readIssueJsonShared, writeIssueJson } from './issueJson.js';
 import { writeJsonAtomic } from './jsonAtomic.js';
 import { appendProgressEvent } from './sqliteStorage.js';
 import { readTasksJson as readTasksStateJson, writeTasksJson as writeTasksStateJson } from './tasksStore.js';
@@ -42,7 +43,7 @@ import {
   updateWaveSummaryWithMerge,
   type WaveMergeResult,
 } from './waveResultMerge.js';
-import { terminateProcess } from './processTermination.js';
+import { terminateProcess, waitForProcessExit } from './processTermination.js';
 
 /** Maximum allowed parallel tasks (hard cap per §6.2.1) */
 export const MAX_PARALLEL_TASKS = 8;
@@ -163,7 +164,7 @@ export interface ParallelRunnerOptions {
   viewerLogPath: string;
   /** Maximum parallel tasks (bounded by MAX_PARALLEL_TASKS) */
   maxParallelTasks: number;
-  /** Callback for appending to viewer log */
+  /** Callback for appending to viewer log; multi-line text is logged one line per entry */
   appendLog: (line: string) => Promise<void>;
   /** Callback for broadcasting status updates */
   broadcast: (event: string, data: unknown) => void;
@@ -1516,7 +1517,9 @@ export class ParallelRunner {
       }
 
       // Wait briefly for terminated processes to exit
-      await new Promise((resolve) => setTimeout(resolve, 100));
+      await Promise.all(
+        startedWorkers.map(({ worker }) => (worker.proc ? waitForProcessExit(worker.proc, 100) : true)),
+      );
 
       // Rollback task reservations
       await rollbackTaskReservations(this.options.canonicalStateDir, reservedStatusByTaskId);
@@ -2178,20 +2181,17 @@ export class ParallelRunner {
     this.broadcastRunStatus();
 
     // Handle stdout/stderr with taskId prefix and record activity for inactivity timeout
-    proc.stdout.on('data', (chunk) => {
+    // Each chunk is forwarded as one multi-line append rather than one call per line.
+    const forwardChunk = (prefix: string, chunk: unknown): void => {
       this.recordActivity();
-      const lines = String(chunk).trimEnd().split('\n');
-      for (const line of lines) {
-        void this.options.appendLog(`[WORKER ${taskId}][STDOUT] ${line}`);
-      }
-    });
-    proc.stderr.on('data', (chunk) => {
-      this.recordActivity();
-      const lines = String(chunk).trimEnd().split('\n');
-      for (const line of lines) {
-        void this.options.appendLog(`[WORKER ${taskId}][STDERR] ${line}`);
-      }
-    });
+      const lines = stripTerminalControls(String(chunk)).trimEnd().split('\n');
+      void this.options.appendLog(lines.map((line) => `${prefix}${line}`).join('\n'));
+    };
+    // Decode as UTF-8 so multi-byte characters split across pipe reads are reassembled.
+    proc.stdout.setEncoding('utf8');
+    proc.stderr.setEncoding('utf8');
+    proc.stdout.on('data', (chunk) => forwardChunk(`[WORKER ${taskId}][STDOUT] `, chunk));
+    proc.stderr.on('data', (chunk) => forwardChunk(`[WORKER ${taskId}][STDERR] `, chunk));
 
     // Handle async spawn errors (e.g., invalid cwd, resource exhaustion, permission errors).
     // Without this handler, Node would throw on the unhandled 'error' event and crash the server.
@@ -2486,7 +2486,7 @@ export async function handleWaveTimeoutCleanup(
  * Checks if parallel execution mode is enabled for an issue.
  */
 export async function isParallelModeEnabled(stateDir: string): Promise<boolean> {
-  const issueJson = await readIssueJson(stateDir);
+  const issueJson = await readIssueJsonShared(stateDir);
   if (!issueJson) return false;
   const settings = issueJson.settings as Record<string, unknown> | undefined;
   if (!settings) return false;
@@ -2499,7 +2499,7 @@ export async function isParallelModeEnabled(stateDir: string): Promise<boolean>
  * Gets the configured maxParallelTasks from issue settings.
  */
 export async function getMaxParallelTasks(stateDir: string): Promise<number> {
-  const issueJson = await readIssueJson(stateDir);
+  const issueJson = await readIssueJsonShared(stateDir);
   if (!issueJson) return 1;
   const settings = issueJson.settings as Record<string, unknown> | undefined;
   if (!settings) return 1;
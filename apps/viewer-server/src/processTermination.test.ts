@@ -1,8 +1,9 @@
 import type { ChildProcess } from 'node:child_process';
+import { EventEmitter } from 'node:events';
 
 import { describe, expect, it, vi } from 'vitest';
 
-import { terminateProcess } from './processTermination.js';
+import { terminateProcess, waitForProcessExit } from './processTermination.js';
 
 describe('terminateProcess', () => {
   it('always attempts proc.kill with the provided signal', () => {
@@ -53,3 +54,28 @@ describe('terminateProcess', () => {
     expect(spawnImpl).not.toHaveBeenCalled();
   });
 });
+
+describe('waitForProcessExit', () => {
+  function makeProc(exitCode: number | null = null) {
+    return Object.assign(new EventEmitter(), { exitCode });
+  }
+
+  it('resolves immediately for a process that has already exited', async () => {
+    await expect(waitForProcessExit(makeProc(0), 1000)).resolves.toBe(true);
+  });
+
+  it('resolves on the exit event without waiting for the timeout', async () => {
+    const proc = makeProc();
+    const startedAt = Date.now();
+    const waiting = waitForProcessExit(proc, 5000);
+    setTimeout(() => proc.emit('exit', 0, null), 10);
+    await expect(waiting).resolves.toBe(true);
+    expect(Date.now() - startedAt).toBeLessThan(1000);
+  });
+
+  it('resolves false after the timeout and detaches its listener', async () => {
+    const proc = makeProc();
+    await expect(waitForProcessExit(proc, 20)).resolves.toBe(false);
+    expect(proc.listenerCount('exit')).toBe(0);
+  });
+});
@@ -55,3 +55,30 @@ export function terminateProcess(
     // ignore
   }
 }
+
+export interface ProcessExitTarget {
+  exitCode: number | null;
+  signalCode?: NodeJS.Signals | null;
+  once: (event: 'exit', listener: () => void) => unknown;
+  removeListener: (event: 'exit', listener: () => void) => unknown;
+}
+
+/**
+ * Resolves true once the process has exited, or false after `timeoutMs`.
+ * Waits on the 'exit' event instead of sleeping a fixed interval, so an
+ * already-dead or quickly-exiting process returns immediately.
+ */
+export function waitForProcessExit(proc: ProcessExitTarget, timeoutMs: number): Promise<boolean> {
+  if (proc.exitCode !== null || (proc.signalCode ?? null) !== null) return Promise.resolve(true);
+  return new Promise((resolve) => {
+    const onExit = (): void => {
+      clearTimeout(timer);
+      resolve(true);
+    };
+    const timer = setTimeout(() => {
+      proc.removeListener('exit', onExit);
+      resolve(false);
+    }, timeoutMs);
+    proc.once('exit', onExit);
+  });
+}
@@ -9,9 +9,9 @@ import { promisify } from 'node:util';
 import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
 
 import { getIssueStateDir, getWorktreePath } from '@jeeves/core';
-import { markMemoryEntryStaleInDb, upsertMemoryEntryInDb } from '@jeeves/state-db';
+import { listRunLogLines, markMemoryEntryStaleInDb, upsertMemoryEntryInDb, upsertRunSession } from '@jeeves/state-db';
 
-import { RunManager } from './runManager.js';
+import { RunManager, iterationWaitTickMs } from './runManager.js';
 import { readIssueJson } from './issueJson.js';
 import { renderProgressText } from './sqliteStorage.js';
 import { installStateDbFsShim } from './testStateDbShim.js';
@@ -4952,13 +4952,17 @@ describe('T18: Manual stop mid-implement skips phase transition to task_spec_che
     await rm.setIssue(issueRef);
 
     const viewerLogPath = path.join(stateDir, 'viewer-run.log');
-    const originalAppendFile = fs.appendFile.bind(fs);
-    const appendSpy = vi.spyOn(fs, 'appendFile').mockImplementation(async (...args: Parameters<typeof fs.appendFile>) => {
-      const [filePath, data] = args;
-      if (filePath === viewerLogPath && String(data).includes('[PREVIOUS-RUN-LINE]')) {
+    // The first viewer-log write opens the append handle; delay that open so
+    // the previous-run line is still in flight when start() truncates the log.
+    const originalOpen = fs.open.bind(fs);
+    let delayedOpen = false;
+    const openSpy = vi.spyOn(fs, 'open').mockImplementation(async (...args: Parameters<typeof fs.open>) => {
+      const [filePath] = args;
+      if (filePath === viewerLogPath && !delayedOpen) {
+        delayedOpen = true;
         await new Promise((resolve) => setTimeout(resolve, 200));
       }
-      return originalAppendFile(...args);
+      return originalOpen(...args);
     });
 
     const pendingPreviousRunWrite = (rm as unknown as {
@@ -4970,12 +4974,55 @@ describe('T18: Manual stop mid-implement skips phase transition to task_spec_che
       await waitFor(() => rm.getStatus().running === false, 5000);
       await pendingPreviousRunWrite;
     } finally {
-      appendSpy.mockRestore();
+      openSpy.mockRestore();
     }
 
+    expect(delayedOpen).toBe(true);
     const viewerLog = await fs.readFile(viewerLogPath, 'utf-8');
     expect(viewerLog).not.toContain('[PREVIOUS-RUN-LINE]');
   }, 10000);
+
+  it('forwards runner output whole when a UTF-8 character spans two pipe reads', async () => {
+    const dataDir = await makeTempDir('jeeves-vs-data-utf8-stdout-');
+    const repoRoot = await makeTempDir('jeeves-vs-repo-utf8-stdout-');
+    await fs.mkdir(path.join(repoRoot, 'packages', 'runner', 'dist'), { recursive: true });
+    await fs.writeFile(path.join(repoRoot, 'packages', 'runner', 'dist', 'bin.js'), '// stub\n', 'utf-8');
+
+    const workflowsDir = path.join(process.cwd(), 'workflows');
+    const promptsDir = path.join(process.cwd(), 'prompts');
+
+    const owner = 'o';
+    const repo = 'r';
+    const issueNumber = 778;
+    const issueRef = `${owner}/${repo}#${issueNumber}`;
+    const stateDir = getIssueStateDir(owner, repo, issueNumber, dataDir);
+    await fs.mkdir(stateDir, { recursive: true });
+    await fs.writeFile(
+      path.join(stateDir, 'issue.json'),
+      JSON.stringify({ repo: `${owner}/${repo}`, issue: { number: issueNumber }, phase: 'hello', workflow: 'fixture-trivial', branch: `issue/${issueNumber}`, notes: '' }, null, 2) + '\n',
+      'utf-8',
+    );
+    await fs.mkdir(getWorktreePath(owner, repo, issueNumber, dataDir), { recursive: true });
+
+    const bytes = Buffer.from('caf\u00e9 ready\n', 'utf-8');
+    const split = bytes.indexOf(0xc3) + 1;
+    const spawn = (() => {
+      const proc = makeFakeChild(0, 50);
+      proc.stdout.write(bytes.subarray(0, split));
+      setTimeout(() => proc.stdout.write(bytes.subarray(split)), 10);
+      return proc;
+    }) as unknown as typeof import('node:child_process').spawn;
+
+    const rm = new RunManager({ promptsDir, workflowsDir, repoRoot, dataDir, spawn, broadcast: () => void 0 });
+    await rm.setIssue(issueRef);
+    await rm.start({ provider: 'fake', max_iterations: 1, inactivity_timeout_sec: 10, iteration_timeout_sec: 10 });
+    await waitFor(() => rm.getStatus().running === false, 5000);
+
+    const viewerLog = await fs.readFile(path.join(stateDir, 'viewer-run.log'), 'utf-8');
+    expect(viewerLog).toContain('[STDOUT] caf\n');
+    expect(viewerLog).toContain('[STDOUT] \u00e9 ready\n');
+    expect(viewerLog).not.toContain('\ufffd');
+  }, 10000);
 });
 
 describe('T7: spec-check split-phase support in runManager', () => {
@@ -5562,3 +5609,167 @@ phases:
     expect(status.returncode).not.toBe(0);
   }, 15000);
 });
+
+describe('RunManager viewer log batching', () => {
+  const previousDbMirror = process.env.JEEVES_DB_MIRROR_IN_TESTS;
+
+  beforeEach(() => {
+    process.env.JEEVES_DB_MIRROR_IN_TESTS = '1';
+  });
+
+  afterEach(() => {
+    if (previousDbMirror === undefined) delete process.env.JEEVES_DB_MIRROR_IN_TESTS;
+    else process.env.JEEVES_DB_MIRROR_IN_TESTS = previousDbMirror;
+  });
+
+  it('batches concurrent lines in order without joining batches for another path or run', async () => {
+    const dataDir = await makeTempDir('jeeves-vs-data-viewer-batch-');
+    const stateDir = path.join(dataDir, 'issues', 'o', 'r', '1');
+    await fs.mkdir(stateDir, { recursive: true });
+    upsertRunSession({ dataDir, runId: 'run-a', stateDir });
+    upsertRunSession({ dataDir, runId: 'run-b', stateDir });
+
+    const rm = new RunManager({
+      promptsDir: path.join(process.cwd(), 'prompts'),
+      workflowsDir: path.join(process.cwd(), 'workflows'),
+      repoRoot: dataDir,
+      dataDir,
+      broadcast: () => void 0,
+    });
+    const internals = rm as unknown as {
+      runId: string | null;
+      appendViewerLog: (path: string, line: string) => Promise<void>;
+      writeViewerLog: (path: string, text: string) => Promise<void>;
+      closeViewerLog: () => Promise<void>;
+    };
+    const writeSpy = vi.spyOn(internals, 'writeViewerLog');
+
+    const logA = path.join(stateDir, 'viewer-run.log');
+    const logB = path.join(stateDir, 'other-viewer-run.log');
+
+    internals.runId = 'run-a';
+    const writes = [
+      internals.appendViewerLog(logA, 'a1'),
+      internals.appendViewerLog(logA, 'a2'),
+      internals.appendViewerLog(logB, 'b1'),
+      internals.appendViewerLog(logA, 'a3'),
+    ];
+    internals.runId = 'run-b';
+    writes.push(internals.appendViewerLog(logA, 'a4'), internals.appendViewerLog(logA, 'a5'));
+    await Promise.all(writes);
+    await internals.closeViewerLog();
+
+    expect(writeSpy.mock.calls).toEqual([
+      [logA, 'a1\na2\n'],
+      [logB, 'b1\n'],
+      [logA, 'a3\n'],
+      [logA, 'a4\na5\n'],
+    ]);
+    expect(await fs.readFile(logA, 'utf-8')).toBe('a1\na2\na3\na4\na5\n');
+    expect(await fs.readFile(logB, 'utf-8')).toBe('b1\n');
+
+    const rowsA = listRunLogLines({ dataDir, runId: 'run-a', scope: 'viewer', stream: 'log' });
+    expect(rowsA.map((row) => row.line)).toEqual(['a1', 'a2', 'b1', 'a3']);
+    const rowsB = listRunLogLines({ dataDir, runId: 'run-b', scope: 'viewer', stream: 'log' });
+    expect(rowsB.map((row) => row.line)).toEqual(['a4', 'a5']);
+  });
+
+  it('does not keep the viewer log open for lines written outside a run', async () => {
+    const dataDir = await makeTempDir('jeeves-vs-data-viewer-idle-handle-');
+    const viewerLogPath = path.join(dataDir, 'viewer-run.log');
+    const rm = new RunManager({
+      promptsDir: path.join(process.cwd(), 'prompts'),
+      workflowsDir: path.join(process.cwd(), 'workflows'),
+      repoRoot: dataDir,
+      dataDir,
+      broadcast: () => void 0,
+    });
+    const internals = rm as unknown as {
+      viewerLogHandle: unknown;
+      appendViewerLog: (path: string, line: string) => Promise<void>;
+    };
+
+    expect(rm.getStatus().running).toBe(false);
+    await internals.appendViewerLog(viewerLogPath, '[DESIGN] late line');
+
+    expect(internals.viewerLogHandle).toBeNull();
+    expect(await fs.readFile(viewerLogPath, 'utf-8')).toBe('[DESIGN] late line\n');
+  });
+});
+
+describe('iterationWaitTickMs', () => {
+  it('backs off with idle time', () => {
+    expect(iterationWaitTickMs({ idleMs: 0, untilTimeoutMs: 600_000 })).toBe(150);
+    expect(iterationWaitTickMs({ idleMs: 10_000, untilTimeoutMs: 600_000 })).toBe(1_000);
+    expect(iterationWaitTickMs({ idleMs: 60_000, untilTimeoutMs: 600_000 })).toBe(5_000);
+  });
+
+  it('never sleeps past the next timeout and keeps a 50ms floor', () => {
+    expect(iterationWaitTickMs({ idleMs: 60_000, untilTimeoutMs: 2_000 })).toBe(2_001);
+    expect(iterationWaitTickMs({ idleMs: 10_000, untilTimeoutMs: 300 })).toBe(301);
+    expect(iterationWaitTickMs({ idleMs: 60_000, untilTimeoutMs: 0 })).toBe(50);
+    expect(iterationWaitTickMs({ idleMs: 60_000, untilTimeoutMs: -1_000 })).toBe(50);
+  });
+
+  it('lets stop() cut a long idle tick short', async () => {
+    const dataDir = await makeTempDir('jeeves-vs-data-idle-stop-');
+    const repoRoot = await makeTempDir('jeeves-vs-repo-idle-stop-');
+    await fs.mkdir(path.join(repoRoot, 'packages', 'runner', 'dist'), { recursive: true });
+    await fs.writeFile(path.join(repoRoot, 'packages', 'runner', 'dist', 'bin.js'), '// stub\n', 'utf-8');
+
+    const workflowsDir = path.join(process.cwd(), 'workflows');
+    const promptsDir = path.join(process.cwd(), 'prompts');
+
+    const owner = 'o';
+    const repo = 'r';
+    const issueNumber = 779;
+    const issueRef = `${owner}/${repo}#${issueNumber}`;
+    const stateDir = getIssueStateDir(owner, repo, issueNumber, dataDir);
+    await fs.mkdir(stateDir, { recursive: true });
+    await fs.writeFile(
+      path.join(stateDir, 'issue.json'),
+      JSON.stringify({ repo: `${owner}/${repo}`, issue: { number: issueNumber }, phase: 'hello', workflow: 'fixture-trivial', branch: `issue/${issueNumber}`, notes: '' }, null, 2) + '\n',
+      'utf-8',
+    );
+    await fs.mkdir(getWorktreePath(owner, repo, issueNumber, dataDir), { recursive: true });
+
+    // A runner that stays silent until it is killed.
+    class SilentChild extends EventEmitter {
+      pid = 12345;
+      exitCode: number | null = null;
+      stdin = new PassThrough();
+      stdout = new PassThrough();
+      stderr = new PassThrough();
+      kill(signal?: NodeJS.Signals | number): boolean {
+        setImmediate(() => this.emit('exit', null, typeof signal === 'string' ? signal : 'SIGTERM'));
+        return true;
+      }
+    }
+    let spawned = false;
+    const spawn = (() => {
+      spawned = true;
+      return new SilentChild();
+    }) as unknown as typeof import('node:child_process').spawn;
+
+    // Pretend the runner has been idle for a minute so the wait loop picks the 5s tick.
+    const realNow = Date.now.bind(Date);
+    let offsetMs = 0;
+    const nowSpy = vi.spyOn(Date, 'now').mockImplementation(() => realNow() + offsetMs);
+    try {
+      const rm = new RunManager({ promptsDir, workflowsDir, repoRoot, dataDir, spawn, broadcast: () => void 0 });
+      await rm.setIssue(issueRef);
+      await rm.start({ provider: 'fake', max_iterations: 1, inactivity_timeout_sec: 3600, iteration_timeout_sec: 3600 });
+      await waitFor(() => spawned, 5000);
+
+      offsetMs = 60_000;
+      await new Promise((resolve) => setTimeout(resolve, 400));
+
+      const stopStartedAt = performance.now();
+      await rm.stop();
+      await waitFor(() => rm.getStatus().running === false, 5000);
+      expect(performance.now() - stopStartedAt).toBeLessThan(2_000);
+    } finally {
+      nowSpy.mockRestore();
+    }
+  }, 10000);
+});
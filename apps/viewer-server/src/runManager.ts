@@ -1,10 +1,10 @@
 import { execFile as execFileCb, spawn as spawnDefault, type ChildProcessWithoutNullStreams } from 'node:child_process';
 import { randomBytes } from 'node:crypto';
-import fs from 'node:fs/promises';
+import fs, { type FileHandle } from 'node:fs/promises';
 import os from 'node:os';
 import path from 'node:path';
 
-import { WorkflowEngine, getIssueStateDir, getWorktreePath, loadWorkflowByName, parseIssueRef, getEffectiveModel, validModels, type ModelId } from '@jeeves/core';
+import { WorkflowEngine, getIssueStateDir, getWorktreePath, loadWorkflowByName, parseIssueRef, getEffectiveModel, stripTerminalControls, validModels, type ModelId, type Workflow } from '@jeeves/core';
 
 function isValidModel(model: unknown): model is ModelId {
   return typeof model === 'string' && validModels.includes(model as ModelId);
@@ -12,13 +12,13 @@ function isValidModel(model: unknown): model is ModelId {
 
 import type { RunStatus } from './types.js';
 import { ensureJeevesExcludedFromGitStatus } from './gitExclude.js';
-import { readIssueJson, writeIssueJson } from './issueJson.js';
+import { readIssueJson, readIssueJsonShared, writeIssueJson } from './issueJson.js';
 import { writeJsonAtomic } from './jsonAtomic.js';
 import {
   appendProgressEvent,
-  appendRunLogLine,
+  appendRunLogLines,
   renderProgressText,
-  listRunLogLines,
+  readLatestRunLogLineId,
   readRunArtifact,
   upsertRunArtifact,
   upsertRunIteration,
@@ -80,8 +80,23 @@ function isPlainRecord(value: unknown): value is Record<string, unknown> {
   return typeof value === 'object' && value !== null && !Array.isArray(value);
 }
 
+const COMPLETION_PROMISE = '<promise>COMPLETE</promise>';
+const COMPLETION_PROMISE_BYTES = Buffer.from(COMPLETION_PROMISE, 'utf-8');
+const ITERATION_BANNER_RULE = '='.repeat(60);
+
+/**
+ * How long the sequential iteration wait sleeps between activity checks.
+ * Short while the runner is logging, longer once it has gone quiet, and never
+ * past the next point where a timeout could fire. Runner exit and stop()
+ * wake the wait early regardless.
+ */
+export function iterationWaitTickMs(params: { idleMs: number; untilTimeoutMs: number }): number {
+  const tierMs = params.idleMs < 5_000 ? 150 : params.idleMs < 30_000 ? 1_000 : 5_000;
+  return Math.max(50, Math.min(tierMs, params.untilTimeoutMs + 1));
+}
+
 function hasCompletionPromise(content: string): boolean {
-  return content.trim() === '<promise>COMPLETE</promise>';
+  return content.trim() === COMPLETION_PROMISE;
 }
 
 function getIssueNumber(issueJson: Record<string, unknown> | null): number | null {
@@ -146,7 +161,22 @@ function validateQuick(value: unknown): boolean | null {
   throw new Error('Invalid quick: must be boolean');
 }
 
+// Run-start limits: anything numeric is clamped to >= 1, anything else falls back.
+const RUN_LIMIT_DEFAULTS = {
+  max_iterations: 10,
+  inactivity_timeout_sec: 600,
+  iteration_timeout_sec: 3600,
+} as const;
+
+function parseRunLimit(value: unknown, name: keyof typeof RUN_LIMIT_DEFAULTS): number {
+  const n = Number(value);
+  return Number.isFinite(n) ? Math.max(1, n) : RUN_LIMIT_DEFAULTS[name];
+}
+
 const PHASE_REPORT_FILE = 'phase-report.json';
+const VIEWER_RUN_LOG_FILE = 'viewer-run.log';
+const SDK_OUTPUT_FILE = 'sdk-output.json';
+const LAST_RUN_LOG_FILE = 'last-run.log';
 
 const TRANSITION_STATUS_FIELDS = [
   'designApproved',
@@ -171,6 +201,8 @@ const TRANSITION_STATUS_FIELDS = [
 type TransitionStatusField = (typeof TRANSITION_STATUS_FIELDS)[number];
 type TransitionStatusUpdates = Partial<Record<TransitionStatusField, boolean>>;
 
+type ViewerLogBatch = { path: string; runId: string | null; lines: string[]; write: Promise<void> };
+
 /** Set of all spec-check phase names (mode-select, legacy, layered, persist). */
 const SPEC_CHECK_PHASES = new Set([
   'task_spec_check',           // legacy single-phase (backward compat)
@@ -349,7 +381,13 @@ export class RunManager {
 
   private proc: ChildProcessWithoutNullStreams | null = null;
   private stopRequested = false;
+  /** Cuts the current sequential-iteration sleep short (set only while waiting). */
+  private wakeIterationWait: (() => void) | null = null;
   private viewerLogWriteQueue: Promise<void> = Promise.resolve();
+  /** Most recent queued viewer-log batch that has not started writing yet. */
+  private pendingViewerLogBatch: ViewerLogBatch | null = null;
+  /** Append handle for the viewer log, kept open only while a run is active. */
+  private viewerLogHandle: { path: string; fh: FileHandle } | null = null;
   private activeParallelRunner: ParallelRunner | null = null;
   private maxParallelTasksOverride: number | null = null;
   /** Tracks the effective max parallel tasks (override or issue setting) for status reporting */
@@ -419,7 +457,7 @@ export class RunManager {
   async setIssue(issueRef: string): Promise<void> {
     const parsed = parseIssueRef(issueRef);
     const stateDir = getIssueStateDir(parsed.owner, parsed.repo, parsed.issueNumber, this.dataDir);
-    const issueJson = await readIssueJson(stateDir);
+    const issueJson = await readIssueJsonShared(stateDir);
     if (!issueJson) {
       throw new Error(`Issue state not found for ${issueRef} at ${stateDir}`);
     }
@@ -431,7 +469,7 @@ export class RunManager {
     this.status = {
       ...this.status,
       issue_ref: this.issueRef,
-      viewer_log_file: path.join(stateDir, 'viewer-run.log'),
+      viewer_log_file: path.join(stateDir, VIEWER_RUN_LOG_FILE),
     };
     this.broadcast('state', await this.getStateSnapshot());
   }
@@ -465,15 +503,17 @@ export class RunManager {
 
     const provider = mapProvider(params.provider);
     const quick = validateQuick(params.quick) ?? false;
-    const maxIterations = Number.isFinite(Number(params.max_iterations)) ? Math.max(1, Number(params.max_iterations)) : 10;
-    const inactivityTimeoutSec = Number.isFinite(Number(params.inactivity_timeout_sec)) ? Math.max(1, Number(params.inactivity_timeout_sec)) : 600;
-    const iterationTimeoutSec = Number.isFinite(Number(params.iteration_timeout_sec)) ? Math.max(1, Number(params.iteration_timeout_sec)) : 3600;
+    const maxIterations = parseRunLimit(params.max_iterations, 'max_iterations');
+    const inactivityTimeoutSec = parseRunLimit(params.inactivity_timeout_sec, 'inactivity_timeout_sec');
+    const iterationTimeoutSec = parseRunLimit(params.iteration_timeout_sec, 'iteration_timeout_sec');
 
-    const viewerLogPath = path.join(this.stateDir, 'viewer-run.log');
+    const viewerLogPath = path.join(this.stateDir, VIEWER_RUN_LOG_FILE);
     await fs.mkdir(path.dirname(viewerLogPath), { recursive: true });
     await this.viewerLogWriteQueue.catch(() => void 0);
+    await this.closeViewerLog();
     await fs.writeFile(viewerLogPath, '', 'utf-8');
     this.viewerLogWriteQueue = Promise.resolve();
+    this.pendingViewerLogBatch = null;
 
     this.stopRequested = false;
     this.stopReason = null;
@@ -550,6 +590,7 @@ export class RunManager {
     const force = Boolean(params?.force ?? false);
     if (isNonEmptyString(params?.reason)) this.stopReason = params?.reason.trim();
     this.stopRequested = true;
+    this.wakeIterationWait?.();
     const proc = this.proc;
     if (proc && proc.exitCode === null) {
       terminateProcess(proc, force ? 'SIGKILL' : 'SIGTERM');
@@ -681,26 +722,68 @@ export class RunManager {
   }
 
   private async appendViewerLog(viewerLogPath: string, line: string): Promise<void> {
-    const runId = this.runId;
-    const queuedWrite = this.viewerLogWriteQueue
+    await this.appendViewerLogLines(viewerLogPath, [line]);
+  }
+
+  /** Appends a group of lines that belong together (banners, summaries) as one write. */
+  private async appendViewerLogLines(viewerLogPath: string, lines: readonly string[]): Promise<void> {
+    if (lines.length === 0) return;
+    // Lines that arrive while an earlier write is still in flight join the
+    // batch queued behind it, so a burst becomes one file write and one DB
+    // transaction instead of one of each per line.
+    const pending = this.pendingViewerLogBatch;
+    if (pending && pending.path === viewerLogPath && pending.runId === this.runId) {
+      pending.lines.push(...lines);
+      await pending.write;
+      return;
+    }
+
+    const batch: ViewerLogBatch = { path: viewerLogPath, runId: this.runId, lines: [...lines], write: Promise.resolve() };
+    batch.write = this.viewerLogWriteQueue
       .catch(() => void 0)
       .then(async () => {
-        await fs.appendFile(viewerLogPath, `${line}\n`, 'utf-8').catch(() => void 0);
-        if (!runId || !this.dbTelemetryEnabled()) return;
+        if (this.pendingViewerLogBatch === batch) this.pendingViewerLogBatch = null;
+        await this.writeViewerLog(viewerLogPath, `${batch.lines.join('\n')}\n`);
+        if (!batch.runId || !this.dbTelemetryEnabled()) return;
         try {
-          appendRunLogLine({
+          appendRunLogLines({
             dataDir: this.dataDir,
-            runId,
+            runId: batch.runId,
             scope: 'viewer',
             stream: 'log',
-            line,
+            lines: batch.lines,
           });
         } catch {
           // ignore telemetry persistence failures; they should not block runs
         }
       });
-    this.viewerLogWriteQueue = queuedWrite;
-    await queuedWrite;
+    this.pendingViewerLogBatch = batch;
+    this.viewerLogWriteQueue = batch.write;
+    await batch.write;
+  }
+
+  private async writeViewerLog(viewerLogPath: string, text: string): Promise<void> {
+    try {
+      let handle = this.viewerLogHandle;
+      if (handle?.path !== viewerLogPath) {
+        await this.closeViewerLog();
+        handle = { path: viewerLogPath, fh: await fs.open(viewerLogPath, 'a') };
+        this.viewerLogHandle = handle;
+      }
+      await handle.fh.write(text);
+      // Lines logged outside a run (a late [DESIGN] or [ERROR] line) must not
+      // leave the handle open until the next start().
+      if (!this.status.running) await this.closeViewerLog();
+    } catch {
+      // Drop the handle so the next line retries with a fresh open.
+      await this.closeViewerLog();
+    }
+  }
+
+  private async closeViewerLog(): Promise<void> {
+    const handle = this.viewerLogHandle;
+    this.viewerLogHandle = null;
+    await handle?.fh.close().catch(() => void 0);
   }
 
   private async spawnRunner(args: string[], viewerLogPath: string, options?: { model?: string; permissionMode?: string }): Promise<number> {
@@ -714,13 +797,10 @@ export class RunManager {
     this.status = { ...this.status, command: `${cmd} ${fullArgs.join(' ')}` };
     this.broadcast('run', { run: this.status });
 
-    await this.appendViewerLog(viewerLogPath, `[RUNNER] ${this.status.command}`);
-    if (options?.model) {
-      await this.appendViewerLog(viewerLogPath, `[RUNNER] model=${options.model}`);
-    }
-    if (options?.permissionMode) {
-      await this.appendViewerLog(viewerLogPath, `[RUNNER] permissionMode=${options.permissionMode}`);
-    }
+    const runnerLines = [`[RUNNER] ${this.status.command}`];
+    if (options?.model) runnerLines.push(`[RUNNER] model=${options.model}`);
+    if (options?.permissionMode) runnerLines.push(`[RUNNER] permissionMode=${options.permissionMode}`);
+    await this.appendViewerLogLines(viewerLogPath, runnerLines);
 
     const env: Record<string, string | undefined> = { ...process.env, JEEVES_DATA_DIR: this.dataDir };
     if (this.runId) {
@@ -744,11 +824,15 @@ export class RunManager {
     this.status = { ...this.status, pid: proc.pid ?? null };
     this.broadcast('run', { run: this.status });
 
-    proc.stdout.on('data', async (chunk) => {
-      await this.appendViewerLog(viewerLogPath, `[STDOUT] ${String(chunk).trimEnd()}`);
+    // Let the streams decode incrementally so a multi-byte character split
+    // across two pipe reads reaches the log whole.
+    proc.stdout.setEncoding('utf8');
+    proc.stderr.setEncoding('utf8');
+    proc.stdout.on('data', (chunk: string) => {
+      void this.appendViewerLog(viewerLogPath, `[STDOUT] ${stripTerminalControls(chunk).trimEnd()}`);
     });
-    proc.stderr.on('data', async (chunk) => {
-      await this.appendViewerLog(viewerLogPath, `[STDERR] ${String(chunk).trimEnd()}`);
+    proc.stderr.on('data', (chunk: string) => {
+      void this.appendViewerLog(viewerLogPath, `[STDERR] ${stripTerminalControls(chunk).trimEnd()}`);
     });
 
     const exitCode = await new Promise<number>((resolve) => {
@@ -775,7 +859,7 @@ export class RunManager {
   }
 
   private async getStateSnapshot() {
-    const issueJson = this.stateDir ? await readIssueJson(this.stateDir) : null;
+    const issueJson = this.stateDir ? await readIssueJsonShared(this.stateDir) : null;
     const taskCount = await this.readTaskCount();
     return {
       issue_ref: this.issueRef,
@@ -798,15 +882,20 @@ export class RunManager {
         dataDir: this.dataDir,
         runId: this.runId,
         scope: 'canonical',
-        name: 'sdk-output.json',
+        name: SDK_OUTPUT_FILE,
       });
-      raw = artifact?.content ? artifact.content.toString('utf-8') : null;
+      if (artifact?.content && artifact.content.length > 0) {
+        // The promise text is written verbatim by JSON.stringify, so a plain
+        // byte search rules out the common case without decoding or parsing.
+        if (!artifact.content.includes(COMPLETION_PROMISE_BYTES)) return false;
+        raw = artifact.content.toString('utf-8');
+      }
     }
     if (!raw) {
-      const sdkPath = path.join(this.stateDir, 'sdk-output.json');
+      const sdkPath = path.join(this.stateDir, SDK_OUTPUT_FILE);
       raw = await fs.readFile(sdkPath, 'utf-8').catch(() => null);
     }
-    if (!raw) return false;
+    if (!raw || !raw.includes(COMPLETION_PROMISE)) return false;
     try {
       const parsed = JSON.parse(raw) as { messages?: unknown[] };
       const messages = Array.isArray(parsed.messages) ? parsed.messages : [];
@@ -835,12 +924,12 @@ export class RunManager {
         dataDir: this.dataDir,
         runId: this.runId,
         scope: 'canonical',
-        name: 'sdk-output.json',
+        name: SDK_OUTPUT_FILE,
       });
       raw = artifact?.content ? artifact.content.toString('utf-8') : null;
     }
     if (!raw) {
-      raw = await fs.readFile(path.join(this.stateDir, 'sdk-output.json'), 'utf-8').catch(() => null);
+      raw = await fs.readFile(path.join(this.stateDir, SDK_OUTPUT_FILE), 'utf-8').catch(() => null);
     }
     if (!raw) return null;
 
@@ -933,8 +1022,10 @@ export class RunManager {
       let completedNaturally = true;
       for (let iteration = 1; iteration <= params.maxIterations; iteration += 1) {
         if (this.stopRequested) {
-          await this.appendViewerLog(viewerLogPath, `[ITERATION] Stop requested, ending at iteration ${iteration}`);
-          await this.appendViewerLog(viewerLogPath, `[STOP] Stop requested; skipping phase transition`);
+          await this.appendViewerLogLines(viewerLogPath, [
+            `[ITERATION] Stop requested, ending at iteration ${iteration}`,
+            `[STOP] Stop requested; skipping phase transition`,
+          ]);
           completedNaturally = false;
           break;
         }
@@ -942,14 +1033,28 @@ export class RunManager {
         this.status = { ...this.status, current_iteration: iteration };
         this.broadcast('run', { run: this.status });
 
-        await this.appendViewerLog(viewerLogPath, '');
-        await this.appendViewerLog(viewerLogPath, `${'='.repeat(60)}`);
-        await this.appendViewerLog(viewerLogPath, `[ITERATION ${iteration}/${params.maxIterations}] Starting fresh context`);
-        await this.appendViewerLog(viewerLogPath, `${'='.repeat(60)}`);
+        await this.appendViewerLogLines(viewerLogPath, [
+          '',
+          ITERATION_BANNER_RULE,
+          `[ITERATION ${iteration}/${params.maxIterations}] Starting fresh context`,
+          ITERATION_BANNER_RULE,
+        ]);
 
 	        const issueJson = this.stateDir ? await readIssueJson(this.stateDir) : null;
 	        if (!issueJson) throw new Error('Issue state not found or invalid');
 
+	        // Workflows resolved while setting up this iteration. The quick-fix probe
+	        // and the main lookup usually ask for the same file, so load it once.
+	        const setupWorkflows = new Map<string, Promise<Workflow>>();
+	        const loadSetupWorkflow = (name: string): Promise<Workflow> => {
+	          let pending = setupWorkflows.get(name);
+	          if (!pending) {
+	            pending = loadWorkflowByName(name, { workflowsDir: this.workflowsDir });
+	            setupWorkflows.set(name, pending);
+	          }
+	          return pending;
+	        };
+
 	        // Auto-route to the `quick-fix` workflow at the beginning of the run (iteration 1).
 	        // Guardrails:
 	        // - Only if no workflow override is set (so the issue can change workflows)
@@ -958,7 +1063,7 @@ export class RunManager {
 	          try {
 	            const currentWorkflow = isNonEmptyString(issueJson.workflow) ? issueJson.workflow.trim() : 'default';
 	            if (currentWorkflow === 'default') {
-	              const defaultWorkflow = await loadWorkflowByName('default', { workflowsDir: this.workflowsDir });
+	              const defaultWorkflow = await loadSetupWorkflow('default');
 	              const currentPhaseRaw = isNonEmptyString(issueJson.phase) ? issueJson.phase.trim() : '';
 	              const currentPhase = currentPhaseRaw || defaultWorkflow.start;
 	              if (currentPhase === defaultWorkflow.start) {
@@ -973,7 +1078,7 @@ export class RunManager {
 	                    env: process.env,
 	                  });
 	                  if (decision.route) {
-	                    const quickWorkflow = await loadWorkflowByName('quick-fix', { workflowsDir: this.workflowsDir });
+	                    const quickWorkflow = await loadSetupWorkflow('quick-fix');
 	                    issueJson.workflow = 'quick-fix';
 	                    issueJson.phase = quickWorkflow.start;
 	                    await writeIssueJson(this.stateDir!, issueJson);
@@ -993,7 +1098,7 @@ export class RunManager {
 	        }
 
 	        const workflowName = params.workflowOverride ?? (isNonEmptyString(issueJson.workflow) ? issueJson.workflow : 'default');
-	        const workflow = await loadWorkflowByName(workflowName, { workflowsDir: this.workflowsDir });
+	        const workflow = await loadSetupWorkflow(workflowName);
 	        const currentPhaseRaw = isNonEmptyString(issueJson.phase) ? issueJson.phase.trim() : '';
 	        let currentPhase = currentPhaseRaw || workflow.start;
 	        if (!workflow.phases[currentPhase]) {
@@ -1050,7 +1155,9 @@ export class RunManager {
           break;
         }
 
-        const issueBeforeIteration = JSON.parse(JSON.stringify(issueJson)) as Record<string, unknown>;
+        // issueJson is a fresh parse owned by this iteration and is not touched
+        // again below, so it can serve as the pre-iteration snapshot as-is.
+        const issueBeforeIteration: Record<string, unknown> = issueJson;
         await this.clearPhaseReportFile();
 
         let lastCanonicalLogId = 0;
@@ -1102,7 +1209,7 @@ export class RunManager {
                 const nextPhase = engine.evaluateTransitions(currentPhase, timeoutIssue);
                 if (nextPhase && nextPhase !== currentPhase) {
                   timeoutIssue.phase = nextPhase;
-                  await writeIssueJson(this.stateDir!, timeoutIssue);
+                  await writeIssueJson(this.stateDir!, timeoutIssue, { durable: true });
                   await this.appendViewerLog(viewerLogPath, `[TIMEOUT] Transitioning phase: ${currentPhase} -> ${nextPhase}`);
                   this.broadcast('state', await this.getStateSnapshot());
                 }
@@ -1151,7 +1258,7 @@ export class RunManager {
                 await this.appendViewerLog(viewerLogPath, `[MERGE_CONFLICT] Transitioning phase: ${currentPhase} -> ${nextPhase}`);
               }
 
-              await writeIssueJson(this.stateDir!, conflictIssue);
+              await writeIssueJson(this.stateDir!, conflictIssue, { durable: true });
               this.broadcast('state', await this.getStateSnapshot());
             }
 
@@ -1204,6 +1311,9 @@ export class RunManager {
             { model: effectiveModel, permissionMode: effectivePermissionMode },
           );
 
+          // Attach the exit handler once; racing a fresh `.then` every tick
+          // would pile up reactions on exitPromise for the whole iteration.
+          const exited = exitPromise.then((code) => ({ done: true as const, code }));
           exitCode = await (async () => {
             while (true) {
               if (this.stopRequested) break;
@@ -1216,16 +1326,16 @@ export class RunManager {
               }
 
               if (this.runId) {
-                const newLogLines = listRunLogLines({
+                // Only activity matters here, so look up the newest id rather
+                // than fetching the lines themselves.
+                const latestLogId = readLatestRunLogLineId({
                   dataDir: this.dataDir,
                   runId: this.runId,
                   scope: 'canonical',
                   stream: 'log',
-                  afterId: lastCanonicalLogId,
-                  limit: 1000,
                 });
-                if (newLogLines.length > 0) {
-                  lastCanonicalLogId = newLogLines[newLogLines.length - 1]?.id ?? lastCanonicalLogId;
+                if (latestLogId > lastCanonicalLogId) {
+                  lastCanonicalLogId = latestLogId;
                   lastChangeAtMs = Date.now();
                 }
               }
@@ -1238,10 +1348,25 @@ export class RunManager {
                 break;
               }
 
+              const nowMs = Date.now();
+              const tickMs = iterationWaitTickMs({
+                idleMs: nowMs - lastChangeAtMs,
+                untilTimeoutMs: Math.min(
+                  params.iterationTimeoutSec * 1000 - (nowMs - startAtMs),
+                  params.inactivityTimeoutSec * 1000 - (nowMs - lastChangeAtMs),
+                ),
+              });
+              let tick: ReturnType<typeof setTimeout> | undefined;
               const done = await Promise.race([
-                exitPromise.then((code) => ({ done: true as const, code })),
-                new Promise<{ done: false }>((r) => setTimeout(() => r({ done: false as const }), 150)),
+                exited,
+                new Promise<{ done: false }>((r) => {
+                  const wake = (): void => r({ done: false as const });
+                  tick = setTimeout(wake, tickMs);
+                  this.wakeIterationWait = wake;
+                }),
               ]);
+              clearTimeout(tick);
+              this.wakeIterationWait = null;
               if (done.done) return done.code;
             }
 
@@ -1362,7 +1487,8 @@ export class RunManager {
               if (Object.keys(control).length === 0) delete updatedIssue.control;
             }
 
-            await writeIssueJson(this.stateDir!, updatedIssue);
+            // Reaching a terminal phase ends the run, so make that state durable.
+            await writeIssueJson(this.stateDir!, updatedIssue, { durable: engine.isTerminal(nextPhase) });
             if (nextPhase === 'implement_task') {
               await expandTasksFilesAllowedForTests(this.stateDir!);
             }
@@ -1433,6 +1559,9 @@ export class RunManager {
       this.broadcast('run', { run: this.status });
       await this.persistLastRunStatus().catch(() => void 0);
       await this.finalizeRunArchive().catch(() => void 0);
+      // Close behind any lines still queued; later appends reopen on demand.
+      this.viewerLogWriteQueue = this.viewerLogWriteQueue.catch(() => void 0).then(() => this.closeViewerLog());
+      await this.viewerLogWriteQueue;
     }
   }
 
@@ -1465,7 +1594,7 @@ export class RunManager {
     const repoDir = path.join(this.dataDir, 'repos', owner, repo);
 
     // Read issue.json to get canonical branch
-    const issueJson = await readIssueJson(this.stateDir);
+    const issueJson = await readIssueJsonShared(this.stateDir);
     if (!issueJson) {
       await this.appendViewerLog(params.viewerLogPath, '[PARALLEL] ERROR: issue state not found');
       return { exitCode: 1, waveExecuted: false };
@@ -1498,7 +1627,7 @@ export class RunManager {
       viewerLogPath: params.viewerLogPath,
       maxParallelTasks,
       appendLog: async (line: string) => {
-        await this.appendViewerLog(params.viewerLogPath, line);
+        await this.appendViewerLogLines(params.viewerLogPath, line.split('\n'));
       },
       broadcast: (event: string, data: unknown) => {
         this.broadcast(event, data);
@@ -1899,8 +2028,8 @@ export class RunManager {
     const copyIfExists = (src: string, dstName: string) => {
       copies.push(fs.copyFile(src, path.join(iterDir, dstName)).catch(() => void 0));
     };
-    copyIfExists(path.join(this.stateDir, 'last-run.log'), 'last-run.log');
-    copyIfExists(path.join(this.stateDir, 'sdk-output.json'), 'sdk-output.json');
+    copyIfExists(path.join(this.stateDir, LAST_RUN_LOG_FILE), LAST_RUN_LOG_FILE);
+    copyIfExists(path.join(this.stateDir, SDK_OUTPUT_FILE), SDK_OUTPUT_FILE);
     copyIfExists(path.join(this.stateDir, PHASE_REPORT_FILE), PHASE_REPORT_FILE);
     copyIfExists(path.join(this.stateDir, ACTIVE_CONTEXT_FILE), ACTIVE_CONTEXT_FILE);
     copyIfExists(path.join(this.stateDir, RETIRED_TRAJECTORY_FILE), RETIRED_TRAJECTORY_FILE);
@@ -1943,7 +2072,7 @@ export class RunManager {
       ).catch(() => void 0);
     }
 
-    const issueSnapshot = await readIssueJson(this.stateDir).catch(() => null);
+    const issueSnapshot = await readIssueJsonShared(this.stateDir).catch(() => null);
     if (issueSnapshot) {
       await writeJsonAtomic(path.join(iterDir, 'issue.json'), issueSnapshot).catch(() => void 0);
     }
@@ -1958,7 +2087,7 @@ export class RunManager {
   private async finalizeRunArchive(): Promise<void> {
     if (!this.stateDir || !this.runId) return;
     if (this.dbTelemetryEnabled()) {
-      const finalIssue = await readIssueJson(this.stateDir);
+      const finalIssue = await readIssueJsonShared(this.stateDir);
       if (finalIssue) {
         upsertRunArtifact({
           dataDir: this.dataDir,
@@ -2014,8 +2143,8 @@ export class RunManager {
       }
     }
     if (!this.runDir) return;
-    await fs.copyFile(path.join(this.stateDir, 'viewer-run.log'), path.join(this.runDir, 'viewer-run.log')).catch(() => void 0);
-    const finalIssue = await readIssueJson(this.stateDir).catch(() => null);
+    await fs.copyFile(path.join(this.stateDir, VIEWER_RUN_LOG_FILE), path.join(this.runDir, VIEWER_RUN_LOG_FILE)).catch(() => void 0);
+    const finalIssue = await readIssueJsonShared(this.stateDir).catch(() => null);
     if (finalIssue) {
       await writeJsonAtomic(path.join(this.runDir, 'final-issue.json'), finalIssue).catch(() => void 0);
     }
@@ -14,7 +14,7 @@ import { readIssueJson } from './issueJson.js';
 import { readAzureDevopsSecret } from './azureDevopsSecret.js';
 import { ProviderAdapterError } from './providerIssueAdapter.js';
 import { acquireLock, readJournal, releaseLock, generateOperationId } from './providerOperationJournal.js';
-import { appendRunLogLine, upsertRunSession } from './sqliteStorage.js';
+import { appendRunLogLine, appendRunLogLines, upsertRunSession } from './sqliteStorage.js';
 import { buildServer } from './server.js';
 import { installStateDbFsShim } from './testStateDbShim.js';
 
@@ -4214,6 +4214,81 @@ describe('sonar-token endpoints', () => {
     await app.close();
   });
 
+  it('streams log rows written between polls and drains a full page without waiting for a new write', async () => {
+    const prevPollMs = process.env.JEEVES_VIEWER_POLL_MS;
+    process.env.JEEVES_VIEWER_POLL_MS = '25';
+    const dataDir = await makeTempDir('jeeves-vs-stream-poll-');
+    const repoRoot = await makeTempDir('jeeves-vs-repo-stream-poll-');
+    const owner = 'testorg';
+    const repo = 'testrepo';
+    const issueRef = `${owner}/${repo}#44`;
+    const stateDir = getIssueStateDir(owner, repo, 44, dataDir);
+    await fs.mkdir(stateDir, { recursive: true });
+    await fs.mkdir(getWorktreePath(owner, repo, 44, dataDir), { recursive: true });
+    await fs.writeFile(path.join(stateDir, 'issue.json'), JSON.stringify({ schemaVersion: 1 }), 'utf-8');
+
+    const runId = 'run-stream-poll';
+    upsertRunSession({
+      dataDir,
+      runId,
+      stateDir,
+      issueRef,
+      startedAt: '2026-02-01T00:00:00.000Z',
+      endedAt: null,
+      status: { running: false },
+      archiveMeta: {},
+    });
+
+    const { app } = await buildServer({
+      host: '127.0.0.1',
+      port: 0,
+      allowRemoteRun: false,
+      dataDir,
+      repoRoot,
+      initialIssue: issueRef,
+    });
+
+    let ws: WebSocket | null = null;
+    try {
+      await app.listen({ port: 0 });
+      const actualAddress = app.server.address();
+      const actualPort = typeof actualAddress === 'object' && actualAddress ? actualAddress.port : 0;
+
+      const receivedLines: { line: string; atMs: number }[] = [];
+      ws = new WebSocket(`ws://127.0.0.1:${actualPort}/api/ws`);
+      ws.on('message', (raw) => {
+        const msg = JSON.parse(decodeWsData(raw)) as { event: string; data: { lines?: unknown } };
+        if (msg.event !== 'logs' || !Array.isArray(msg.data?.lines)) return;
+        const atMs = performance.now();
+        for (const line of msg.data.lines) receivedLines.push({ line: String(line), atMs });
+      });
+      await new Promise<void>((resolve) => {
+        ws!.on('open', resolve);
+      });
+      await new Promise((resolve) => setTimeout(resolve, 100));
+
+      appendRunLogLine({ dataDir, runId, scope: 'canonical', stream: 'log', line: 'BETWEEN-TICKS' });
+      await waitFor(() => receivedLines.some((entry) => entry.line === 'BETWEEN-TICKS'), 3000);
+
+      // More than one page in a single write: the second page must follow on the
+      // next tick rather than waiting out the forced re-poll interval.
+      const bulk = Array.from({ length: 2500 }, (_, i) => `BULK-${i}`);
+      appendRunLogLines({ dataDir, runId, scope: 'canonical', stream: 'log', lines: bulk });
+      await waitFor(() => receivedLines.some((entry) => entry.line === 'BULK-2499'), 3000);
+
+      const bulkLines = receivedLines.filter((entry) => entry.line.startsWith('BULK-'));
+      expect(bulkLines.map((entry) => entry.line)).toEqual(bulk);
+      const firstPageAt = bulkLines[0]!.atMs;
+      const lastPageAt = bulkLines[bulkLines.length - 1]!.atMs;
+      expect(lastPageAt - firstPageAt).toBeLessThan(800);
+    } finally {
+      ws?.close();
+      await app.close();
+      if (prevPollMs === undefined) delete process.env.JEEVES_VIEWER_POLL_MS;
+      else process.env.JEEVES_VIEWER_POLL_MS = prevPollMs;
+    }
+  });
+
   it('/api/init/issue triggers auto-reconcile and emits sonar-token-status', async () => {
     const dataDir = await makeTempDir('jeeves-vs-init-autoreconcile-');
     const owner = 'testorg';
@@ -31,14 +31,17 @@ import { EventHub } from './eventHub.js';
 import { CreateGitHubIssueError, createGitHubIssue as defaultCreateGitHubIssue } from './githubIssueCreate.js';
 import { initIssue } from './init.js';
 import { runIssueExpand, buildSuccessResponse } from './issueExpand.js';
-import { listIssueJsonStates, readIssueJson, readIssueJsonUpdatedAtMs, writeIssueJson } from './issueJson.js';
+import { listIssueJsonStates, readIssueJson, readIssueJsonShared, writeIssueJson } from './issueJson.js';
 import { findRepoRoot } from './repoRoot.js';
 import { RunManager } from './runManager.js';
 import {
+  dbPathForDataDir,
   getDbHealth,
   getLatestRunIdForStateDir,
   listRunLogLines,
+  listRunLogTail,
   listRunSdkEvents,
+  readLatestRunSdkEventId,
   runDbBackup,
   runDbIntegrityCheck,
   runDbVacuum,
@@ -117,9 +120,15 @@ import {
 } from './providerIssueState.js';
 import type { CreateGitHubIssueAdapter, CreateProviderIssueAdapter, LookupExistingIssueAdapter, FetchAzureHierarchyAdapter } from './types.js';
 
+/** Page size for the per-tick run log / SDK event cursor queries. */
+const STREAM_POLL_LIMIT = 2000;
+/** Upper bound on how long pollTick trusts an unchanged DB stat before querying anyway. */
+const STREAM_FORCE_POLL_MS = 1000;
+
+const LOCAL_ADDRESSES: ReadonlySet<string> = new Set(['127.0.0.1', '::1', '::ffff:127.0.0.1']);
+
 function isLocalAddress(addr: string | undefined | null): boolean {
-  const a = (addr ?? '').trim();
-  return a === '127.0.0.1' || a === '::1' || a === '::ffff:127.0.0.1';
+  return addr != null && LOCAL_ADDRESSES.has(addr);
 }
 
 function parseAllowedOriginsFromEnv(): Set<string> {
@@ -310,12 +319,18 @@ function normalizePromptId(promptId: string): string {
   return promptId.split('\\').join('/');
 }
 
+// NUL, directory separators, or a `..` anywhere in a workflow name.
+const UNSAFE_WORKFLOW_NAME_RE = /[\0/\\]|\.\./;
+// A prompt id segment that is empty, `.` or `..` (covers leading, trailing and
+// doubled separators as well as traversal), with `/` and `\` both separators.
+const UNSAFE_PROMPT_SEGMENT_RE = /(?:^|[/\\])\.{0,2}(?:[/\\]|$)/;
+const VALID_WORKFLOW_NAME_RE = /^[a-zA-Z0-9][a-zA-Z0-9_-]*$/;
+
 function getWorkflowNameParamInfo(raw: string): { name: string; fileName: string } | null {
   const trimmed = raw.trim();
   if (!trimmed) return null;
-  if (trimmed.includes('\0')) return null;
-  // Prevent path traversal or directory separators.
-  if (trimmed.includes('..') || trimmed.includes('/') || trimmed.includes('\\')) return null;
+  // Prevent NUL bytes, path traversal or directory separators.
+  if (UNSAFE_WORKFLOW_NAME_RE.test(trimmed)) return null;
 
   if (trimmed.endsWith('.yaml')) {
     const name = trimmed.slice(0, -'.yaml'.length);
@@ -326,16 +341,13 @@ function getWorkflowNameParamInfo(raw: string): { name: string; fileName: string
 }
 
 function isValidWorkflowName(name: string): boolean {
-  return /^[a-zA-Z0-9][a-zA-Z0-9_-]*$/.test(name);
+  return VALID_WORKFLOW_NAME_RE.test(name);
 }
 
 function isSafePromptId(promptId: string): boolean {
   if (!promptId.trim()) return false;
   if (promptId.includes('\0')) return false;
-  const normalized = normalizePromptId(promptId);
-  if (normalized.startsWith('/')) return false;
-  if (normalized.split('/').some((part) => part === '' || part === '.' || part === '..')) return false;
-  return true;
+  return !UNSAFE_PROMPT_SEGMENT_RE.test(promptId);
 }
 
 async function ensureNoSymlinkParents(baseDir: string, relPath: string): Promise<void> {
@@ -703,28 +715,22 @@ export async function buildServer(config: ViewerServerConfig) {
   let canonicalLogCursor = 0;
   let viewerLogCursor = 0;
   let sdkCursor = 0;
-  let cachedIssueJsonStateDir: string | null = null;
-  let cachedIssueJsonMtimeMs = 0;
-  let cachedIssueJson: Record<string, unknown> | null = null;
+  const dbFilePath = dbPathForDataDir(dataDir);
+  let lastStreamDbKey: string | null = null;
+  let lastStreamRunId: string | null = null;
+  let lastStreamPollAtMs = 0;
   let warnedMissingWorkerArtifactsRunId = false;
 
-  async function readIssueJsonCached(stateDir: string): Promise<Record<string, unknown> | null> {
-    const updatedAtMs = await readIssueJsonUpdatedAtMs(stateDir);
-    if (updatedAtMs <= 0) {
-      cachedIssueJsonStateDir = stateDir;
-      cachedIssueJsonMtimeMs = 0;
-      cachedIssueJson = null;
-      return null;
-    }
-
-    if (cachedIssueJsonStateDir === stateDir && updatedAtMs === cachedIssueJsonMtimeMs) {
-      return cachedIssueJson;
-    }
-
-    cachedIssueJsonStateDir = stateDir;
-    cachedIssueJsonMtimeMs = updatedAtMs;
-    cachedIssueJson = await readIssueJson(stateDir);
-    return cachedIssueJson;
+  // A cheap hint that the database may have changed, not a guarantee. After a
+  // checkpoint SQLite rewrites the WAL from the start, so a new write can leave
+  // the WAL the same size with an mtime within the filesystem's granularity.
+  // Only the STREAM_FORCE_POLL_MS re-poll in pollTick guarantees delivery.
+  async function readStreamDbKey(): Promise<string> {
+    const [main, wal] = await Promise.all([
+      fs.stat(dbFilePath).catch(() => null),
+      fs.stat(`${dbFilePath}-wal`).catch(() => null),
+    ]);
+    return `${main?.size ?? -1}:${main?.mtimeMs ?? 0}|${wal?.size ?? -1}:${wal?.mtimeMs ?? 0}`;
   }
 
   function resolveCurrentRunId(stateDir: string | null): string | null {
@@ -744,15 +750,13 @@ export async function buildServer(config: ViewerServerConfig) {
   }): { lines: string[]; cursor: number } {
     if (!params.runId) return { lines: [], cursor: 0 };
     if (params.maxLines <= 0) return { lines: [], cursor: 0 };
-    const rows = listRunLogLines({
+    const tailRows = listRunLogTail({
       dataDir,
       runId: params.runId,
       scope: params.scope,
       stream: 'log',
-      afterId: 0,
-      limit: Math.max(params.maxLines * 4, params.maxLines),
+      limit: params.maxLines,
     });
-    const tailRows = rows.length > params.maxLines ? rows.slice(rows.length - params.maxLines) : rows;
     const cursor = tailRows[tailRows.length - 1]?.id ?? 0;
     return { lines: tailRows.map((row) => row.line), cursor };
   }
@@ -780,11 +784,17 @@ export async function buildServer(config: ViewerServerConfig) {
     if (stateDir !== currentStateDir || runId !== currentRunId) {
       currentStateDir = stateDir;
       currentRunId = runId;
-      cachedIssueJsonStateDir = null;
-      cachedIssueJsonMtimeMs = 0;
-      cachedIssueJson = null;
       warnedMissingWorkerArtifactsRunId = false;
 
+      // With nobody connected there is no one to send a snapshot to; only the
+      // cursors need to advance. New clients get their own snapshot on connect.
+      if (hub.clientCount === 0) {
+        canonicalLogCursor = listLogSnapshotLines({ runId, scope: 'canonical', maxLines: 1 }).cursor;
+        viewerLogCursor = listLogSnapshotLines({ runId, scope: 'viewer', maxLines: 1 }).cursor;
+        sdkCursor = runId ? readLatestRunSdkEventId({ dataDir, runId, scope: 'canonical' }) : 0;
+        return;
+      }
+
       const canonicalSnapshot = listLogSnapshotLines({
         runId,
         scope: 'canonical',
@@ -849,7 +859,7 @@ export async function buildServer(config: ViewerServerConfig) {
 
   async function getStateSnapshot(): Promise<Record<string, unknown>> {
     const issue = runManager.getIssue();
-    const issueJson = issue.stateDir ? await readIssueJson(issue.stateDir) : null;
+    const issueJson = issue.stateDir ? await readIssueJsonShared(issue.stateDir) : null;
     return {
       issue_ref: issue.issueRef,
       paths: {
@@ -1004,15 +1014,24 @@ export async function buildServer(config: ViewerServerConfig) {
       await refreshRunTargets();
       if (!currentStateDir) return;
 
-      if (currentRunId) {
+      const streamDbKey = currentRunId ? await readStreamDbKey() : null;
+      const nowMs = Date.now();
+      const streamChanged =
+        streamDbKey !== lastStreamDbKey ||
+        currentRunId !== lastStreamRunId ||
+        nowMs - lastStreamPollAtMs >= STREAM_FORCE_POLL_MS;
+
+      if (currentRunId && streamChanged) {
+        let saturated = false;
         const logRows = listRunLogLines({
           dataDir,
           runId: currentRunId,
           scope: 'canonical',
           stream: 'log',
           afterId: canonicalLogCursor,
-          limit: 2000,
+          limit: STREAM_POLL_LIMIT,
         });
+        if (logRows.length >= STREAM_POLL_LIMIT) saturated = true;
         if (logRows.length > 0) {
           canonicalLogCursor = logRows[logRows.length - 1]?.id ?? canonicalLogCursor;
           hub.broadcast('logs', { lines: logRows.map((row) => row.line) });
@@ -1024,8 +1043,9 @@ export async function buildServer(config: ViewerServerConfig) {
           scope: 'viewer',
           stream: 'log',
           afterId: viewerLogCursor,
-          limit: 2000,
+          limit: STREAM_POLL_LIMIT,
         });
+        if (viewerRows.length >= STREAM_POLL_LIMIT) saturated = true;
         if (viewerRows.length > 0) {
           viewerLogCursor = viewerRows[viewerRows.length - 1]?.id ?? viewerLogCursor;
           hub.broadcast('viewer-logs', { lines: viewerRows.map((row) => row.line) });
@@ -1036,21 +1056,28 @@ export async function buildServer(config: ViewerServerConfig) {
           runId: currentRunId,
           scope: 'canonical',
           afterId: sdkCursor,
-          limit: 2000,
+          limit: STREAM_POLL_LIMIT,
         });
+        if (sdkRows.length >= STREAM_POLL_LIMIT) saturated = true;
         if (sdkRows.length > 0) {
           sdkCursor = replaySdkRowsToClient(
             (event, data) => hub.broadcast(event, data),
             sdkRows.map((row) => ({ id: row.id, event: row.event })),
           );
         }
+
+        // A full page means more rows are waiting; leave the key stale so the
+        // next tick drains them even if nothing new is written.
+        lastStreamDbKey = saturated ? null : streamDbKey;
+        lastStreamRunId = currentRunId;
+        lastStreamPollAtMs = nowMs;
       }
 
       // Reconcile worker tailers with active workers and poll for events
       const runStatus = runManager.getStatus();
       const activeWorkers = runStatus.workers ?? [];
       const issueJsonForWorkers =
-        activeWorkers.length > 0 ? await readIssueJsonCached(currentStateDir) : null;
+        activeWorkers.length > 0 ? await readIssueJsonShared(currentStateDir) : null;
       const workerArtifactsRunId = resolveWorkerArtifactsRunId({ run: runStatus, issueJson: issueJsonForWorkers });
       if (activeWorkers.length > 0 && !workerArtifactsRunId && !warnedMissingWorkerArtifactsRunId) {
         warnedMissingWorkerArtifactsRunId = true;
@@ -2518,7 +2545,7 @@ export async function buildServer(config: ViewerServerConfig) {
 	  app.get('/api/issue/task-execution', async (_req, reply) => {
 	    const issue = runManager.getIssue();
 	    if (!issue.stateDir) return reply.code(400).send({ ok: false, error: 'No issue selected.' });
-	    const issueJson = await readIssueJson(issue.stateDir);
+	    const issueJson = await readIssueJsonShared(issue.stateDir);
 	    if (!issueJson) return reply.code(404).send({ ok: false, error: 'issue.json not found.' });
 
 	    const settings = (issueJson.settings && typeof issueJson.settings === 'object' && !Array.isArray(issueJson.settings))
@@ -2613,7 +2640,7 @@ export async function buildServer(config: ViewerServerConfig) {
 
 		  app.get('/api/workflow', async (_req, reply) => {
 		    const issue = runManager.getIssue();
-		    const issueJson = issue.stateDir ? await readIssueJson(issue.stateDir) : null;
+		    const issueJson = issue.stateDir ? await readIssueJsonShared(issue.stateDir) : null;
 		    const workflowName = (issueJson && typeof issueJson.workflow === 'string' && issueJson.workflow.trim()) ? issueJson.workflow : 'default';
 
 	    try {
@@ -73,6 +73,18 @@ describe('sqliteStorage normalized schema', () => {
     }
   });
 
+  it('stores durable issue writes the same way as regular writes', async () => {
+    const dataDir = await makeTempDir('jeeves-sqlite-storage-durable-');
+    const stateDir = path.join(dataDir, 'issues', 'acme', 'rocket', '103');
+    await fs.mkdir(stateDir, { recursive: true });
+
+    writeIssueToDb(stateDir, { repo: 'acme/rocket', issue: { number: 103 }, phase: 'design' });
+    writeIssueToDb(stateDir, { repo: 'acme/rocket', issue: { number: 103 }, phase: 'complete' }, { durable: true });
+
+    expect(readIssueFromDb(stateDir)?.phase).toBe('complete');
+    expect(listIssuesFromDb(dataDir).map((row) => row.phase)).toEqual(['complete']);
+  });
+
   it('normalizes tasks and dependencies and reconstructs task JSON', async () => {
     const dataDir = await makeTempDir('jeeves-sqlite-tasks-');
     const stateDir = path.join(dataDir, 'issues', 'acme', 'rocket', '200');
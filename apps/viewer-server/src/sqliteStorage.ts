@@ -13,19 +13,26 @@ export {
   listRunArtifacts,
   listRunIterations,
   listRunLogLines,
+  listRunLogTail,
   listRunSdkEvents,
   listRunSessionsForStateDir,
   listWorkerStates,
   listIssuesFromDb,
+  listPromptIdsFromDb,
   listPromptsFromDb,
+  listWorkflowNamesFromDb,
   listWorkflowsFromDb,
   loadActiveIssueFromDb,
   markBootstrapComplete,
   appendProgressEvent,
   appendRunLogLine,
+  appendRunLogLines,
   appendRunSdkEvent,
   pruneRunsForStateDir,
   readIssueFromDb,
+  readLatestRunLogLineId,
+  readLatestRunSdkEventId,
+  readIssuePayloadFromDb,
   readIssueUpdatedAtMs,
   readRunArtifact,
   readRunSession,
@@ -30,6 +30,58 @@ describe('LogTailer', () => {
     const afterTruncate = await tailer.getNewLines();
     expect(afterTruncate.lines).toEqual(['x', 'y']);
   });
+
+  it('starts over when the log file is replaced by a new file', async () => {
+    const dir = await makeTempDir('jeeves-vs-logtailer-replace-');
+    const filePath = path.join(dir, 'last-run.log');
+    await fs.writeFile(filePath, 'old 1\n', 'utf-8');
+
+    const tailer = new LogTailer();
+    tailer.reset(filePath);
+    expect((await tailer.getNewLines()).lines).toEqual(['old 1']);
+    expect((await tailer.getNewLines()).changed).toBe(false);
+
+    const replacement = path.join(dir, 'next.log');
+    await fs.writeFile(replacement, 'new 1\nnew 2\n', 'utf-8');
+    await fs.rename(replacement, filePath);
+    expect((await tailer.getNewLines()).lines).toEqual(['new 1', 'new 2']);
+
+    tailer.close();
+    await fs.appendFile(filePath, 'new 3\n', 'utf-8');
+    expect((await tailer.getNewLines()).lines).toEqual(['new 3']);
+  });
+
+  it('keeps partial lines and split UTF-8 sequences until the newline arrives', async () => {
+    const dir = await makeTempDir('jeeves-vs-logtailer-utf8-');
+    const filePath = path.join(dir, 'last-run.log');
+    const bytes = Buffer.from('first\r\ncaf\u00e9 done\n', 'utf-8');
+    const split = bytes.indexOf(0xc3) + 1;
+    await fs.writeFile(filePath, bytes.subarray(0, split));
+
+    const tailer = new LogTailer();
+    tailer.reset(filePath);
+
+    const first = await tailer.getNewLines();
+    expect(first.lines).toEqual(['first']);
+
+    await fs.appendFile(filePath, bytes.subarray(split));
+    const second = await tailer.getNewLines();
+    expect(second.lines).toEqual(['caf\u00e9 done']);
+  });
+
+  it('reads the tail without splitting UTF-8 sequences at chunk boundaries', async () => {
+    const dir = await makeTempDir('jeeves-vs-logtailer-tail-');
+    const filePath = path.join(dir, 'last-run.log');
+    // 65535 bytes after the two-byte e-acute put the 64 KiB backward read
+    // boundary between its bytes.
+    const long = `caf\u00e9${'z'.repeat(65534)}`;
+    await fs.writeFile(filePath, `start\r\n${long}\n`, 'utf-8');
+
+    const tailer = new LogTailer();
+    tailer.reset(filePath);
+    expect(await tailer.getAllLines(10)).toEqual(['start', long]);
+    expect(await tailer.getAllLines(1)).toEqual([long]);
+  });
 });
 
 describe('SdkOutputTailer', () => {
@@ -103,4 +155,21 @@ describe('SdkOutputTailer', () => {
       },
     ]);
   });
+
+  it('skips re-reading an unchanged sdk-output file', async () => {
+    const dir = await makeTempDir('jeeves-vs-sdktailer-');
+    const filePath = path.join(dir, 'sdk-output.json');
+    await fs.writeFile(filePath, JSON.stringify({ session_id: 's1', messages: [] }), 'utf-8');
+
+    const tailer = new SdkOutputTailer();
+    tailer.reset(filePath);
+
+    const first = await tailer.readSnapshotIfChanged();
+    expect(first?.session_id).toBe('s1');
+    expect(await tailer.readSnapshotIfChanged()).toBeNull();
+
+    await fs.writeFile(filePath, JSON.stringify({ session_id: 's1', messages: [{ type: 'assistant' }] }), 'utf-8');
+    const updated = await tailer.readSnapshotIfChanged();
+    expect(updated?.messages).toHaveLength(1);
+  });
 });
@@ -1,4 +1,6 @@
-import fs from 'node:fs/promises';
+import fs, { type FileHandle } from 'node:fs/promises';
+
+import { stripTerminalControls } from '@jeeves/core';
 
 type SdkOutputV1 = {
   schema?: string;
@@ -14,12 +16,38 @@ type SdkOutputV1 = {
 export class LogTailer {
   private filePath: string | null = null;
   private offset = 0;
-  private leftover = '';
+  // Bytes after the last newline seen, kept undecoded so a UTF-8 sequence
+  // split across two reads is decoded whole once the line completes.
+  private leftover: Buffer = Buffer.alloc(0);
+  // Scratch buffer reused across polls so a steadily appended log doesn't
+  // allocate a fresh Buffer every tick. Deltas larger than
+  // MAX_RETAINED_READ_BYTES get a one-off buffer instead of growing this one.
+  private readBuf: Buffer = Buffer.alloc(0);
+
+  // Handle kept open between getNewLines() polls; reopened when the path
+  // starts pointing at a different inode (file replaced or rotated).
+  private fh: FileHandle | null = null;
+  private fhIno = 0;
+  // Inode the offset refers to; survives close() so reopening resumes.
+  private fileIno = 0;
+
+  private static readonly MAX_RETAINED_READ_BYTES = 1024 * 1024;
 
   reset(filePath: string | null): void {
+    this.close();
     this.filePath = filePath;
+    this.fileIno = 0;
     this.offset = 0;
-    this.leftover = '';
+    this.leftover = Buffer.alloc(0);
+    this.readBuf = Buffer.alloc(0);
+  }
+
+  /** Releases the polling file handle; the next getNewLines() reopens it. */
+  close(): void {
+    const fh = this.fh;
+    this.fh = null;
+    this.fhIno = 0;
+    if (fh) void fh.close().catch(() => void 0);
   }
 
   async getAllLines(maxLines: number): Promise<string[]> {
@@ -31,29 +59,50 @@ export class LogTailer {
     if (!stat || !stat.isFile()) return [];
     if (stat.size === 0) return [];
 
+    // Walk backwards in fixed-size chunks, splitting on newline bytes and
+    // decoding only the lines kept. Working on bytes keeps a UTF-8 sequence
+    // that straddles a chunk boundary intact, and only the requested tail is
+    // ever turned into strings.
     const chunkSize = 64 * 1024;
+    const buf = Buffer.alloc(Math.min(chunkSize, stat.size));
     let pos = stat.size;
-    let carry = '';
+    let carry: Buffer = Buffer.alloc(0);
     const outRev: string[] = [];
+    // Whether the bytes at the current end position are followed by '\n';
+    // false only while still inside an unterminated final line.
+    let endsAtNewline = false;
+    const pushLine = (data: Buffer, from: number, to: number, beforeNewline: boolean): void => {
+      const lineEnd = beforeNewline && to > from && data[to - 1] === 0x0d ? to - 1 : to;
+      outRev.push(stripTerminalControls(data.toString('utf-8', from, lineEnd)));
+    };
 
     const fh = await fs.open(this.filePath, 'r');
     try {
       while (pos > 0 && outRev.length < maxLines) {
         const isEndChunk = pos === stat.size;
         const start = Math.max(0, pos - chunkSize);
-        const toRead = pos - start;
-        const buf = Buffer.alloc(toRead);
-        const { bytesRead } = await fh.read(buf, 0, toRead, start);
-        const chunkText = buf.subarray(0, bytesRead).toString('utf-8');
-
-        const text = chunkText + carry;
-        const parts = text.split(/\r?\n/);
-        if (isEndChunk && /\r?\n$/.test(text) && parts.length && parts[parts.length - 1] === '') parts.pop();
-        carry = start > 0 ? (parts.shift() ?? '') : '';
-
-        for (let i = parts.length - 1; i >= 0 && outRev.length < maxLines; i -= 1) {
-          const line = parts[i];
-          outRev.push(line);
+        const { bytesRead } = await fh.read(buf, 0, pos - start, start);
+        const chunk = buf.subarray(0, bytesRead);
+        const data = carry.length > 0 ? Buffer.concat([chunk, carry]) : chunk;
+
+        let end = data.length;
+        if (isEndChunk && end > 0 && data[end - 1] === 0x0a) {
+          end -= 1;
+          endsAtNewline = true;
+        }
+        let nl = end > 0 ? data.lastIndexOf(0x0a, end - 1) : -1;
+        while (nl !== -1 && outRev.length < maxLines) {
+          pushLine(data, nl + 1, end, endsAtNewline);
+          endsAtNewline = true;
+          end = nl;
+          nl = end > 0 ? data.lastIndexOf(0x0a, end - 1) : -1;
+        }
+
+        if (start > 0) {
+          // `data` may alias the reused read buffer, so copy the partial line.
+          carry = Buffer.from(data.subarray(0, end));
+        } else if (outRev.length < maxLines) {
+          pushLine(data, 0, end, endsAtNewline);
         }
 
         pos = start;
@@ -72,32 +121,47 @@ export class LogTailer {
       .catch(() => null);
     if (!stat || !stat.isFile()) return { lines: [], changed: false };
 
-    if (stat.size < this.offset) {
+    // A different inode is a new file (replaced or rotated); a smaller size is
+    // the same file truncated. Either way start over from the beginning.
+    if ((this.fileIno !== 0 && stat.ino !== this.fileIno) || stat.size < this.offset) {
       this.offset = 0;
-      this.leftover = '';
+      this.leftover = Buffer.alloc(0);
     }
+    this.fileIno = stat.ino;
     const toRead = stat.size - this.offset;
     if (toRead <= 0) return { lines: [], changed: false };
 
-    const fh = await fs.open(this.filePath, 'r');
+    if (!this.fh || this.fhIno !== stat.ino) {
+      this.close();
+      this.fh = await fs.open(this.filePath, 'r');
+      this.fhIno = stat.ino;
+    }
+    const fh = this.fh;
     try {
-      const buf = Buffer.alloc(toRead);
+      if (this.readBuf.length < toRead && toRead <= LogTailer.MAX_RETAINED_READ_BYTES) {
+        this.readBuf = Buffer.allocUnsafe(toRead);
+      }
+      const buf = this.readBuf.length >= toRead ? this.readBuf : Buffer.allocUnsafe(toRead);
       const { bytesRead } = await fh.read(buf, 0, toRead, this.offset);
       this.offset += bytesRead;
-      const text = this.leftover + buf.subarray(0, bytesRead).toString('utf-8');
-      const parts = text.split(/\r?\n/);
-      const endsWithNewline = /\r?\n$/.test(text);
-      if (!endsWithNewline) {
-        this.leftover = parts.pop() ?? '';
-      } else {
-        this.leftover = '';
-        // drop final empty segment
-        if (parts.length && parts[parts.length - 1] === '') parts.pop();
+      const chunk = buf.subarray(0, bytesRead);
+      const data = this.leftover.length > 0 ? Buffer.concat([this.leftover, chunk]) : chunk;
+
+      // Split at the byte level: only complete lines are decoded, and the
+      // trailing partial line is copied out (buf may be the reused scratch).
+      const lastNewline = data.lastIndexOf(0x0a);
+      if (lastNewline === -1) {
+        this.leftover = Buffer.from(data);
+        return { lines: [], changed: false };
       }
-      const lines = parts;
+      this.leftover = Buffer.from(data.subarray(lastNewline + 1));
+      const end = lastNewline > 0 && data[lastNewline - 1] === 0x0d ? lastNewline - 1 : lastNewline;
+      const lines = stripTerminalControls(data.toString('utf-8', 0, end)).split(/\r?\n/);
       return { lines, changed: lines.length > 0 };
-    } finally {
-      await fh.close();
+    } catch (err) {
+      // Drop the handle so a transient failure doesn't stick to later polls.
+      this.close();
+      throw err;
     }
   }
 }
@@ -109,9 +173,11 @@ export class SdkOutputTailer {
   private toolSeen = new Set<string>();
   private toolCompleted = new Set<string>();
   private ended = false;
+  private lastReadKey: string | null = null;
 
   reset(filePath: string | null): void {
     this.filePath = filePath;
+    this.lastReadKey = null;
     this.lastSessionId = null;
     this.lastMessageCount = 0;
     this.toolSeen = new Set();
@@ -134,6 +200,24 @@ export class SdkOutputTailer {
     }
   }
 
+  /**
+   * Like readSnapshot(), but returns null without reading or parsing when the
+   * file's size and mtime are unchanged since the last successful read.
+   * Pollers use this so an idle sdk-output.json isn't re-parsed every tick.
+   */
+  async readSnapshotIfChanged(): Promise<SdkOutputV1 | null> {
+    if (!this.filePath) return null;
+    const stat = await fs
+      .stat(this.filePath)
+      .catch(() => null);
+    if (!stat || !stat.isFile()) return null;
+    const key = `${stat.size}:${stat.mtimeMs}`;
+    if (key === this.lastReadKey) return null;
+    const snapshot = await this.readSnapshot();
+    if (snapshot) this.lastReadKey = key;
+    return snapshot;
+  }
+
   consumeAndDiff(snapshot: SdkOutputV1): {
     sessionChanged: boolean;
     sessionId: string | null;
@@ -0,0 +1,16 @@
+import { describe, expect, it } from 'vitest';
+
+import { stripTerminalControls } from './ansi.js';
+
+describe('stripTerminalControls', () => {
+  it('returns plain text unchanged', () => {
+    const line = 'npm test\tpassed (12 files)';
+    expect(stripTerminalControls(line)).toBe(line);
+  });
+
+  it('removes color, cursor and OSC sequences plus stray control characters', () => {
+    expect(stripTerminalControls('\u001b[1;32mPASS\u001b[0m src/a.test.ts')).toBe('PASS src/a.test.ts');
+    expect(stripTerminalControls('\u001b[2K\u001b[?25lrunning')).toBe('running');
+    expect(stripTerminalControls('\u001b]0;title\u0007done\u0008')).toBe('done');
+  });
+});
@@ -0,0 +1,17 @@
+// CSI sequences (colors, cursor movement) and OSC sequences (titles, links).
+// eslint-disable-next-line no-control-regex
+const ANSI_ESCAPE_RE = /\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)/g;
+// C0 controls other than tab/newline/carriage return, plus DEL and stray ESC.
+// eslint-disable-next-line no-control-regex
+const CONTROL_CHAR_RE = /[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]/g;
+const NEEDS_STRIP_RE = new RegExp(CONTROL_CHAR_RE.source);
+
+/**
+ * Removes terminal escape sequences and control characters from process output
+ * before it is logged and streamed to the viewer, which renders lines as plain
+ * text. Lines without any control characters are returned unchanged.
+ */
+export function stripTerminalControls(text: string): string {
+  if (!NEEDS_STRIP_RE.test(text)) return text;
+  return text.replace(ANSI_ESCAPE_RE, '').replace(CONTROL_CHAR_RE, '');
+}
@@ -49,6 +49,7 @@ export {
   toRawWorkflowJson,
 } from './workflowLoader.js';
 
+export { stripTerminalControls } from './ansi.js';
 export { evaluateGuard } from './guards.js';
 export { WorkflowEngine } from './workflowEngine.js';
 export { resolvePromptPath } from './promptResolution.js';
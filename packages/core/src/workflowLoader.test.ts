@@ -1,3 +1,6 @@
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
 import { fileURLToPath } from 'node:url';
 
 import { describe, expect, it } from 'vitest';
@@ -5,6 +8,30 @@ import { describe, expect, it } from 'vitest';
 import { loadWorkflowFromFile, parseWorkflowObject, parseWorkflowYaml, toRawWorkflowJson, toWorkflowYaml } from './workflowLoader.js';
 
 describe('workflowLoader', () => {
+  it('reuses an unchanged workflow file and reloads it after an edit', async () => {
+    const defaultPath = fileURLToPath(new URL('../../../workflows/default.yaml', import.meta.url));
+    const tmpDir = await fs.mkdtemp(path.join(os.tmpdir(), 'jeeves-workflow-cache-'));
+    try {
+      const workflowPath = path.join(tmpDir, 'default.yaml');
+      const text = await fs.readFile(defaultPath, 'utf-8');
+      await fs.writeFile(workflowPath, text, 'utf-8');
+
+      const first = await loadWorkflowFromFile(workflowPath);
+      const second = await loadWorkflowFromFile(workflowPath);
+      expect(second).toBe(first);
+
+      await fs.writeFile(workflowPath, text.replace('start: design_classify', 'start: design_research'), 'utf-8');
+      const future = new Date(Date.now() + 5_000);
+      await fs.utimes(workflowPath, future, future);
+
+      const edited = await loadWorkflowFromFile(workflowPath);
+      expect(edited).not.toBe(first);
+      expect(edited.start).toBe('design_research');
+    } finally {
+      await fs.rm(tmpDir, { recursive: true, force: true });
+    }
+  });
+
   it('loads and validates the repo default workflow YAML', async () => {
     const workflowPath = fileURLToPath(new URL('../../../workflows/default.yaml', import.meta.url));
     const workflow = await loadWorkflowFromFile(workflowPath);
@@ -157,6 +184,20 @@ describe('workflowLoader', () => {
     expect('provider' in phasesSection.start).toBe(false);
   });
 
+  it('toRawWorkflowJson reuses the JSON form per workflow instance', () => {
+    const raw = {
+      workflow: { name: 'cache-test', version: 1, start: 'start' },
+      phases: {
+        start: { type: 'execute', prompt: 'Do the thing.', transitions: [{ to: 'complete' }] },
+        complete: { type: 'terminal' },
+      },
+    };
+    const workflow = parseWorkflowObject(raw);
+
+    expect(toRawWorkflowJson(workflow)).toBe(toRawWorkflowJson(workflow));
+    expect(toRawWorkflowJson(parseWorkflowObject(raw))).not.toBe(toRawWorkflowJson(workflow));
+  });
+
   it('round-trips phase mcp_profile', () => {
     const workflow = parseWorkflowObject({
       workflow: {
@@ -565,4 +606,68 @@ describe('workflowLoader', () => {
       }),
     ).toThrow(/permission_mode 'plan' requires effective provider 'claude'/i);
   });
+
+  it('reuses the parsed workflow for identical YAML and reparses when it changes', () => {
+    const yamlText = [
+      'workflow:',
+      '  name: cached',
+      '  version: 1',
+      '  start: start',
+      'phases:',
+      '  start:',
+      '    type: execute',
+      '    prompt: start.md',
+      '    transitions:',
+      '      - to: complete',
+      '  complete:',
+      '    type: terminal',
+      '',
+    ].join('\n');
+
+    const first = parseWorkflowYaml(yamlText, { sourceName: 'cached' });
+    const second = parseWorkflowYaml(yamlText, { sourceName: 'cached' });
+    expect(second).toBe(first);
+
+    const edited = parseWorkflowYaml(yamlText.replace('version: 1', 'version: 2'), { sourceName: 'cached' });
+    expect(edited).not.toBe(first);
+    expect(edited.version).toBe(2);
+  });
+
+  it('builds the raw JSON form once per workflow instance', () => {
+    const workflow = parseWorkflowObject({
+      workflow: { name: 'json-cache', version: 1, start: 'start' },
+      phases: {
+        start: { type: 'execute', prompt: 'Start', transitions: [{ to: 'complete' }] },
+        complete: { type: 'terminal' },
+      },
+    });
+
+    const first = toRawWorkflowJson(workflow);
+    expect(toRawWorkflowJson(workflow)).toBe(first);
+    expect(toRawWorkflowJson({ ...workflow })).not.toBe(first);
+    expect(toRawWorkflowJson({ ...workflow })).toEqual(first);
+  });
+
+  it('rejects transitions to inherited object keys and reports the first transition error', () => {
+    expect(() =>
+      parseWorkflowObject({
+        workflow: { name: 'proto', version: 1, start: 'start' },
+        phases: {
+          start: { type: 'execute', prompt: 'Start', transitions: [{ to: 'constructor' }] },
+          complete: { type: 'terminal' },
+        },
+      }),
+    ).toThrow(/unknown phase 'constructor'/);
+
+    expect(() =>
+      parseWorkflowObject({
+        workflow: { name: 'multi', version: 1, start: 'start' },
+        phases: {
+          start: { type: 'execute', transitions: [{ to: 'complete' }] },
+          middle: { type: 'execute', prompt: 'Middle', transitions: [{ to: 'missing' }] },
+          complete: { type: 'terminal' },
+        },
+      }),
+    ).toThrow(/transition to unknown phase 'missing'/);
+  });
 });
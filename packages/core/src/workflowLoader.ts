@@ -209,13 +209,14 @@ function validateWorkflow(workflow: Workflow): void {
     }
   };
 
-  if (!workflow.phases[workflow.start]) {
+  const phaseNames = new Set(Object.keys(workflow.phases));
+  if (!phaseNames.has(workflow.start)) {
     throw new WorkflowValidationError(`Start phase '${workflow.start}' not found in workflow phases`);
   }
 
   for (const [phaseName, phase] of Object.entries(workflow.phases)) {
     for (const transition of phase.transitions) {
-      if (!workflow.phases[transition.to]) {
+      if (!phaseNames.has(transition.to)) {
         throw new WorkflowValidationError(
           `Phase '${phaseName}' has transition to unknown phase '${transition.to}'`,
         );
@@ -316,10 +317,28 @@ function validateWorkflow(workflow: Workflow): void {
   }
 }
 
+const MAX_PARSED_WORKFLOWS = 32;
+// Keyed by sourceName; a hit requires the exact same YAML text, so edits made
+// through any path (DB store, file on disk) naturally miss. Workflows are
+// Readonly, so sharing one normalized instance between callers is safe.
+const parsedWorkflowCache = new Map<string, { yamlText: string; workflow: Workflow }>();
+
 export function parseWorkflowYaml(yamlText: string, options?: { sourceName?: string }): Workflow {
+  const sourceName = options?.sourceName ?? 'workflow';
+  const cached = parsedWorkflowCache.get(sourceName);
+  if (cached && cached.yamlText === yamlText) return cached.workflow;
+
   const parsed = parseYaml(yamlText) as unknown;
   const raw = rawWorkflowSchema.parse(parsed);
-  return normalizeWorkflow(raw, options?.sourceName ?? 'workflow');
+  const workflow = normalizeWorkflow(raw, sourceName);
+
+  parsedWorkflowCache.delete(sourceName);
+  if (parsedWorkflowCache.size >= MAX_PARSED_WORKFLOWS) {
+    const oldest = parsedWorkflowCache.keys().next().value;
+    if (oldest !== undefined) parsedWorkflowCache.delete(oldest);
+  }
+  parsedWorkflowCache.set(sourceName, { yamlText, workflow });
+  return workflow;
 }
 
 export function parseWorkflowObject(raw: unknown, options?: { sourceName?: string }): Workflow {
@@ -327,9 +346,27 @@ export function parseWorkflowObject(raw: unknown, options?: { sourceName?: strin
   return normalizeWorkflow(parsed, options?.sourceName ?? 'workflow');
 }
 
+// Keyed by resolved path; size + mtime stand in for the file contents, so an
+// unchanged workflow file is served after a stat, without reading or parsing.
+const loadedWorkflowFileCache = new Map<string, { size: number; mtimeMs: number; workflow: Workflow }>();
+
 export async function loadWorkflowFromFile(filePath: string): Promise<Workflow> {
+  const resolved = path.resolve(filePath);
+  const stat = await fs.stat(resolved).catch(() => null);
+  const cached = loadedWorkflowFileCache.get(resolved);
+  if (stat && cached && cached.size === stat.size && cached.mtimeMs === stat.mtimeMs) return cached.workflow;
+
   const content = await fs.readFile(filePath, 'utf-8');
-  return parseWorkflowYaml(content, { sourceName: path.basename(filePath, path.extname(filePath)) });
+  const workflow = parseWorkflowYaml(content, { sourceName: path.basename(filePath, path.extname(filePath)) });
+  if (stat) {
+    loadedWorkflowFileCache.delete(resolved);
+    if (loadedWorkflowFileCache.size >= MAX_PARSED_WORKFLOWS) {
+      const oldest = loadedWorkflowFileCache.keys().next().value;
+      if (oldest !== undefined) loadedWorkflowFileCache.delete(oldest);
+    }
+    loadedWorkflowFileCache.set(resolved, { size: stat.size, mtimeMs: stat.mtimeMs, workflow });
+  }
+  return workflow;
 }
 
 export async function loadWorkflowByName(
@@ -353,7 +390,23 @@ export async function loadWorkflowByName(
   return loadWorkflowFromFile(resolved);
 }
 
-export function toRawWorkflowJson(workflow: Workflow): UnknownRecord {
+// Workflows are immutable and parseWorkflowYaml hands out a shared instance
+// for unchanged YAML, so the JSON form can be built once per workflow.
+const rawWorkflowJsonCache = new WeakMap<Workflow, UnknownRecord>();
+
+/**
+ * Returns the snake_case JSON form of a workflow. The result is cached per
+ * workflow instance and shared between callers; treat it as read-only.
+ */
+export function toRawWorkflowJson(workflow: Workflow): Readonly<UnknownRecord> {
+  const cached = rawWorkflowJsonCache.get(workflow);
+  if (cached) return cached;
+  const json = buildRawWorkflowJson(workflow);
+  rawWorkflowJsonCache.set(workflow, json);
+  return json;
+}
+
+function buildRawWorkflowJson(workflow: Workflow): UnknownRecord {
   const phases: Record<string, UnknownRecord> = {};
   for (const [name, phase] of Object.entries(workflow.phases)) {
     const phaseJson: UnknownRecord = {
@@ -2,7 +2,7 @@ import fs from 'node:fs/promises';
 import os from 'node:os';
 import path from 'node:path';
 
-import { describe, expect, it } from 'vitest';
+import { afterEach, describe, expect, it, vi } from 'vitest';
 
 import { SdkOutputWriterV1 } from './outputWriter.js';
 
@@ -11,6 +11,10 @@ async function makeTempDir(prefix: string): Promise<string> {
 }
 
 describe('SdkOutputWriterV1', () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
   it('updates tool_calls entry on tool_result', async () => {
     const tmp = await makeTempDir('jeeves-output-writer-');
     const outputPath = path.join(tmp, 'sdk-output.json');
@@ -162,4 +166,128 @@ describe('SdkOutputWriterV1', () => {
     const rawFromDisk = await fs.readFile(path.join(tmp, artifactPath!), 'utf-8');
     expect(rawFromDisk).toBe(rawOutput);
   });
+
+  it('skips non-forced writes when nothing changed since the last write', async () => {
+    const tmp = await makeTempDir('jeeves-output-writer-');
+    const outputPath = path.join(tmp, 'sdk-output.json');
+
+    const writer = new SdkOutputWriterV1({ outputPath });
+    writer.addProviderEvent({
+      type: 'assistant',
+      content: 'hello',
+      timestamp: '2026-01-01T00:00:00.000Z',
+    });
+    await writer.writeIncremental({ minIntervalMs: 0 });
+    await fs.rm(outputPath);
+
+    await writer.writeIncremental({ minIntervalMs: 0 });
+    await expect(fs.stat(outputPath)).rejects.toThrow();
+
+    writer.addProviderEvent({
+      type: 'assistant',
+      content: 'again',
+      timestamp: '2026-01-01T00:00:01.000Z',
+    });
+    await writer.writeIncremental({ minIntervalMs: 0 });
+    const written = JSON.parse(await fs.readFile(outputPath, 'utf-8')) as { messages: unknown[] };
+    expect(written.messages).toHaveLength(2);
+  });
+
+  it('backs off the write interval only under write pressure and decays afterwards', async () => {
+    const tmp = await makeTempDir('jeeves-output-writer-');
+    const writer = new SdkOutputWriterV1({ outputPath: path.join(tmp, 'sdk-output.json') });
+    let clockMs = 0;
+    vi.spyOn(performance, 'now').mockImplementation(() => clockMs);
+    const intervalMs = (): number => (writer as unknown as { writeIntervalMs: number }).writeIntervalMs;
+    let n = 0;
+    const write = async (opts: { durationMs?: number; overlap?: boolean } = {}): Promise<void> => {
+      writer.addProviderEvent({ type: 'assistant', content: `m${n++}` });
+      const pending = writer.writeIncremental();
+      if (opts.overlap) await writer.writeIncremental();
+      clockMs += opts.durationMs ?? 10;
+      await pending;
+    };
+
+    // A steady stream of quick writes stays at the base interval.
+    await write();
+    clockMs = 1_000;
+    await write();
+    clockMs = 2_000;
+    await write();
+    expect(intervalMs()).toBe(750);
+
+    // A call that finds a write still in flight, or a slow write, backs off.
+    clockMs = 3_000;
+    await write({ overlap: true });
+    expect(intervalMs()).toBe(1_125);
+    clockMs = 5_000;
+    await write({ durationMs: 600 });
+    expect(intervalMs()).toBe(1_688);
+
+    // Quick writes again decay back towards the base interval.
+    clockMs = 8_000;
+    await write();
+    expect(intervalMs()).toBe(1_125);
+    clockMs = 10_000;
+    await write();
+    expect(intervalMs()).toBe(750);
+  });
+
+  it('drops a non-forced write while one is in flight and lets a forced write wait its turn', async () => {
+    const tmp = await makeTempDir('jeeves-output-writer-');
+    const outputPath = path.join(tmp, 'sdk-output.json');
+    const writer = new SdkOutputWriterV1({ outputPath });
+    const internals = writer as unknown as { writeSnapshot: (options: { pretty: boolean }) => Promise<void> };
+    const original = internals.writeSnapshot.bind(writer);
+    let releaseFirst!: () => void;
+    const firstGate = new Promise<void>((resolve) => {
+      releaseFirst = resolve;
+    });
+    const started: number[] = [];
+    const snapshotSpy = vi.spyOn(internals, 'writeSnapshot').mockImplementation(async (options) => {
+      started.push(started.length);
+      if (started.length === 1) await firstGate;
+      await original(options);
+    });
+
+    writer.addProviderEvent({ type: 'assistant', content: 'first' });
+    const first = writer.writeIncremental({ minIntervalMs: 0 });
+
+    writer.addProviderEvent({ type: 'assistant', content: 'second' });
+    await writer.writeIncremental({ minIntervalMs: 0 });
+    expect(snapshotSpy).toHaveBeenCalledTimes(1);
+
+    writer.addProviderEvent({ type: 'assistant', content: 'latest' });
+    const forced = writer.writeIncremental({ force: true });
+    await new Promise((resolve) => setImmediate(resolve));
+    expect(snapshotSpy).toHaveBeenCalledTimes(1);
+
+    releaseFirst();
+    await Promise.all([first, forced]);
+    expect(snapshotSpy).toHaveBeenCalledTimes(2);
+    const written = JSON.parse(await fs.readFile(outputPath, 'utf-8')) as { messages: { content?: unknown }[] };
+    expect(written.messages.map((m) => m.content)).toEqual(['first', 'second', 'latest']);
+  });
+
+  it('retries after a failed write because the writer stays dirty', async () => {
+    const tmp = await makeTempDir('jeeves-output-writer-');
+    const outputPath = path.join(tmp, 'sdk-output.json');
+    const writer = new SdkOutputWriterV1({ outputPath });
+    const internals = writer as unknown as { writeSnapshot: (options: { pretty: boolean }) => Promise<void> };
+    const original = internals.writeSnapshot.bind(writer);
+    vi.spyOn(internals, 'writeSnapshot')
+      .mockImplementationOnce(async () => {
+        throw new Error('ENOSPC: no space left on device');
+      })
+      .mockImplementation(original);
+
+    writer.addProviderEvent({ type: 'assistant', content: 'hello' });
+    await expect(writer.writeIncremental({ minIntervalMs: 0 })).rejects.toThrow('ENOSPC');
+    await expect(fs.stat(outputPath)).rejects.toThrow();
+
+    // No new event: only the dirty flag left by the failure triggers this write.
+    await writer.writeIncremental({ minIntervalMs: 0 });
+    const written = JSON.parse(await fs.readFile(outputPath, 'utf-8')) as { messages: unknown[] };
+    expect(written.messages).toHaveLength(1);
+  });
 });
@@ -1,5 +1,6 @@
 import fs from 'node:fs/promises';
 import path from 'node:path';
+import { performance } from 'node:perf_hooks';
 
 import { appendRunSdkEvent, upsertRunArtifact } from '@jeeves/state-db';
 
@@ -25,22 +26,33 @@ function chunkText(input: string, maxChars: number): string[] {
   return chunks;
 }
 
-async function writeJsonAtomic(filePath: string, data: unknown): Promise<void> {
+async function writeTextAtomic(filePath: string, content: string): Promise<void> {
   const dir = path.dirname(filePath);
   await fs.mkdir(dir, { recursive: true });
   const tmp = `${filePath}.tmp`;
-  await fs.writeFile(tmp, `${JSON.stringify(data, null, 2)}\n`, 'utf-8');
-  // Best-effort cross-platform atomic-ish write:
-  // - write to temp file
-  // - replace destination (Windows rename doesn't overwrite)
-  await fs
-    .rm(filePath, { force: true })
-    .catch(() => void 0);
-  await fs.rename(tmp, filePath);
+  await fs.writeFile(tmp, content, 'utf-8');
+  // rename() atomically replaces the destination on POSIX, so readers (e.g.
+  // the viewer's worker tailers) never see a missing or partial file. Only
+  // fall back to remove-then-rename where rename refuses to overwrite
+  // (Windows).
+  try {
+    await fs.rename(tmp, filePath);
+  } catch {
+    await fs
+      .rm(filePath, { force: true })
+      .catch(() => void 0);
+    await fs.rename(tmp, filePath);
+  }
 }
 
 export class SdkOutputWriterV1 {
   private static readonly RAW_TOOL_OUTPUT_CHUNK_CHARS = 64_000;
+  // Default incremental-write throttle. It backs off towards the max while
+  // writes can't keep up (a call found a write still in flight, or a write
+  // took a large share of the interval) and decays back once they do.
+  private static readonly BASE_WRITE_INTERVAL_MS = 750;
+  private static readonly MAX_WRITE_INTERVAL_MS = 5_000;
+  private static readonly SLOW_WRITE_FRACTION = 0.25;
 
   private readonly outputPath: string;
   private readonly rawToolOutputDir: string;
@@ -59,7 +71,15 @@ export class SdkOutputWriterV1 {
   private error: { message: string; type: string } | null = null;
   private sessionId: string | null = null;
   private usage: UsageData | null = null;
-  private lastWriteAtMs = 0;
+  // Monotonic (performance.now) so wall-clock adjustments can't stall or
+  // burst the write throttle.
+  private lastWriteAtMs = Number.NEGATIVE_INFINITY;
+  private writeIntervalMs = SdkOutputWriterV1.BASE_WRITE_INTERVAL_MS;
+  // Set whenever the snapshot content changes; writeIncremental skips
+  // non-forced writes while clean so bursts of events coalesce into one write.
+  private dirty = true;
+  private writeInFlight: Promise<void> | null = null;
+  private writeSkippedInFlight = false;
   private completionEventEmitted = false;
   private readonly pendingRawArtifactWrites: {
     absPath: string;
@@ -154,6 +174,7 @@ export class SdkOutputWriterV1 {
   }
 
   setSessionId(sessionId: string | null): void {
+    if (sessionId !== this.sessionId) this.dirty = true;
     this.sessionId = sessionId;
   }
 
@@ -183,6 +204,7 @@ export class SdkOutputWriterV1 {
 
   addProviderEvent(event: ProviderEvent): void {
     const timestamp = event.timestamp ?? nowIso();
+    this.dirty = true;
 
     if (event.type === 'usage') {
       this.usage = event.usage;
@@ -298,6 +320,7 @@ export class SdkOutputWriterV1 {
   }
 
   setError(err: unknown): void {
+    this.dirty = true;
     if (err instanceof Error) {
       this.error = { message: err.message, type: err.name };
     } else {
@@ -308,8 +331,9 @@ export class SdkOutputWriterV1 {
   finalize(success: boolean): void {
     this.success = success;
     this.endedAt = nowIso();
+    this.dirty = true;
     if (!this.completionEventEmitted) {
-      const snapshot = this.snapshot();
+      const snapshot = this.buildSnapshot({ copyArrays: false });
       this.emitSdkEvent(
         'sdk-complete',
         {
@@ -323,6 +347,12 @@ export class SdkOutputWriterV1 {
   }
 
   snapshot(): SdkOutputV1 {
+    return this.buildSnapshot({ copyArrays: true });
+  }
+
+  // Internal callers that only serialize or read stats skip copying the
+  // message/tool-call arrays; snapshot() keeps returning detached copies.
+  private buildSnapshot(options: { copyArrays: boolean }): SdkOutputV1 {
     const endedAt = this.endedAt || nowIso();
     const durationSeconds = Math.max(
       0,
@@ -335,8 +365,8 @@ export class SdkOutputWriterV1 {
       started_at: this.startedAt,
       ended_at: endedAt,
       success: this.success,
-      messages: [...this.messages],
-      tool_calls: [...this.toolCalls],
+      messages: options.copyArrays ? [...this.messages] : this.messages,
+      tool_calls: options.copyArrays ? [...this.toolCalls] : this.toolCalls,
       stats: {
         message_count: this.messages.length,
         tool_call_count: this.toolCalls.length,
@@ -368,15 +398,61 @@ export class SdkOutputWriterV1 {
   }
 
   async writeIncremental(options?: { force?: boolean; minIntervalMs?: number }): Promise<void> {
-    const minIntervalMs = options?.minIntervalMs ?? 750;
+    const adaptive = options?.minIntervalMs === undefined;
+    const minIntervalMs = options?.minIntervalMs ?? this.writeIntervalMs;
     const force = options?.force ?? false;
-    const nowMs = Date.now();
-    if (!force && nowMs - this.lastWriteAtMs < minIntervalMs) return;
+    // Writes are serialized: a non-forced write while another is in flight is
+    // dropped (the dirty flag carries it to the next call), a forced write
+    // waits its turn.
+    while (this.writeInFlight) {
+      if (!force) {
+        this.writeSkippedInFlight = true;
+        return;
+      }
+      await this.writeInFlight.catch(() => void 0);
+    }
+    const nowMs = performance.now();
+    const sinceLastWriteMs = nowMs - this.lastWriteAtMs;
+    if (!force && (!this.dirty || sinceLastWriteMs < minIntervalMs)) return;
+    // Clear before any await: events added while this write is in flight mark
+    // the writer dirty again and are picked up by the next call.
+    this.dirty = false;
+    const write = this.writeSnapshot({ pretty: force })
+      .catch((err: unknown) => {
+        this.dirty = true;
+        throw err;
+      })
+      .finally(() => {
+        if (this.writeInFlight === write) this.writeInFlight = null;
+      });
+    this.writeInFlight = write;
+    await write;
+    this.lastWriteAtMs = nowMs;
+    if (!force && adaptive) this.adaptWriteInterval(performance.now() - nowMs);
+  }
+
+  private adaptWriteInterval(writeDurationMs: number): void {
+    const underPressure =
+      this.writeSkippedInFlight ||
+      writeDurationMs > this.writeIntervalMs * SdkOutputWriterV1.SLOW_WRITE_FRACTION;
+    this.writeSkippedInFlight = false;
+    this.writeIntervalMs = underPressure
+      ? Math.min(SdkOutputWriterV1.MAX_WRITE_INTERVAL_MS, Math.round(this.writeIntervalMs * 1.5))
+      : Math.max(SdkOutputWriterV1.BASE_WRITE_INTERVAL_MS, Math.round(this.writeIntervalMs / 1.5));
+  }
+
+  private async writeSnapshot(options: { pretty: boolean }): Promise<void> {
     await this.flushPendingRawArtifacts();
-    const snapshot = this.snapshot();
-    await writeJsonAtomic(this.outputPath, snapshot);
+    // Serialize once; the same text backs both the file and the DB artifact.
+    // Periodic snapshots are written compact: JSON.stringify without an indent
+    // argument is markedly faster and the output is smaller. Forced writes
+    // (finalize/error) keep the readable indented form.
+    const text = options.pretty
+      ? `${JSON.stringify(this.buildSnapshot({ copyArrays: false }), null, 2)}\n`
+      : `${JSON.stringify(this.buildSnapshot({ copyArrays: false }))}\n`;
+    await writeTextAtomic(this.outputPath, text);
     if (this.dbContext) {
-      const content = Buffer.from(`${JSON.stringify(snapshot, null, 2)}\n`, 'utf-8');
+      const content = Buffer.from(text, 'utf-8');
       upsertRunArtifact({
         dataDir: this.dbContext.dataDir,
         runId: this.dbContext.runId,
@@ -387,6 +463,5 @@ export class SdkOutputWriterV1 {
         content,
       });
     }
-    this.lastWriteAtMs = nowMs;
   }
 }
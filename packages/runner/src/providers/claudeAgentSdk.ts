@@ -1,3 +1,5 @@
+import { performance } from 'node:perf_hooks';
+
 import type { AgentProvider, ProviderEvent, ProviderRunOptions, UsageData } from '../provider.js';
 
 // NOTE: Keep all SDK imports in this file so the rest of the runner is provider-agnostic.
@@ -41,21 +43,38 @@ function safeCompactString(value: unknown): string {
   }
 }
 
+function textOfBlock(block: unknown): string | undefined {
+  if (!block || typeof block !== 'object') return undefined;
+  const b = block as { type?: unknown; text?: unknown };
+  return b.type === 'text' && typeof b.text === 'string' ? b.text : undefined;
+}
+
+// Concatenated text of all `text` blocks, or null when there are none.
+function extractTextFromContentBlocks(content: readonly unknown[]): string | null {
+  // Most SDK messages carry a single text block; return it directly.
+  if (content.length === 1) {
+    const only = textOfBlock(content[0]);
+    if (only !== undefined) return only;
+  }
+
+  // Concatenate directly; V8 builds this as a rope, so no parts array is
+  // needed for the multi-block case either.
+  let combined: string | null = null;
+  for (const block of content) {
+    const text = textOfBlock(block);
+    if (text !== undefined) combined = combined === null ? text : combined + text;
+  }
+  return combined;
+}
+
 function extractTextFromMessageParam(message: SDKUserMessage['message']): string {
   if (typeof message === 'string') return message;
 
   const content = (message as { content?: unknown }).content;
   if (typeof content === 'string') return content;
   if (Array.isArray(content)) {
-    const parts: string[] = [];
-    for (const block of content) {
-      if (!block || typeof block !== 'object') continue;
-      const text = (block as { type?: unknown; text?: unknown }).type === 'text'
-        ? (block as { text?: unknown }).text
-        : undefined;
-      if (typeof text === 'string') parts.push(text);
-    }
-    if (parts.length) return parts.join('');
+    const text = extractTextFromContentBlocks(content);
+    if (text !== null) return text;
   }
 
   return JSON.stringify(message);
@@ -65,41 +84,50 @@ function extractTextFromAssistantMessage(message: SDKAssistantMessage['message']
   const content = (message as { content?: unknown }).content;
   if (typeof content === 'string') return content;
   if (Array.isArray(content)) {
-    const parts: string[] = [];
-    for (const block of content) {
-      if (!block || typeof block !== 'object') continue;
-      const b = block as { type?: unknown; text?: unknown };
-      if (b.type === 'text' && typeof b.text === 'string') parts.push(b.text);
-    }
-    if (parts.length) return parts.join('');
+    const text = extractTextFromContentBlocks(content);
+    if (text !== null) return text;
   }
   return JSON.stringify(message);
 }
 
+// Hook callbacks can push while a drained batch is being yielded, hence the
+// outer loop. splice(0) avoids the O(n) re-indexing that shift() costs per item.
+function* drainPendingEvents(pendingEvents: ProviderEvent[]): Generator<ProviderEvent> {
+  while (pendingEvents.length) {
+    const batch = pendingEvents.splice(0);
+    for (const event of batch) yield event;
+  }
+}
+
 function extractResultContent(result: SDKResultMessage): string {
   if (result.subtype === 'success') return result.result;
   return result.errors.join('\n');
 }
 
-function inferCommandFromToolInput(
-  toolName: string,
-  input: Record<string, unknown>,
-): string | undefined {
-  const normalized = toolName.trim().toLowerCase();
-  if (normalized === 'bash' || normalized.endsWith('/bash') || normalized.endsWith(':bash')) {
-    return typeof input.command === 'string' ? input.command : toolName;
-  }
-  if (normalized === 'read' || normalized.endsWith('/read') || normalized.endsWith(':read')) {
-    if (typeof input.file_path === 'string') return `read ${input.file_path}`;
-    return toolName;
-  }
-  if (normalized === 'grep' || normalized.endsWith('/grep') || normalized.endsWith(':grep')) {
+type ToolCommandFormatter = (input: Record<string, unknown>, toolName: string) => string;
+
+// Keyed by the lower-cased base tool name (MCP-style `server/tool` and
+// `server:tool` prefixes are stripped before lookup).
+const TOOL_COMMAND_FORMATTERS: ReadonlyMap<string, ToolCommandFormatter> = new Map<string, ToolCommandFormatter>([
+  ['bash', (input, toolName) => (typeof input.command === 'string' ? input.command : toolName)],
+  ['read', (input, toolName) => (typeof input.file_path === 'string' ? `read ${input.file_path}` : toolName)],
+  ['grep', (input, toolName) => {
     const pattern = typeof input.pattern === 'string' ? input.pattern : '';
     const searchPath = typeof input.path === 'string' ? input.path : '';
     if (pattern && searchPath) return `grep ${pattern} ${searchPath}`;
     if (pattern) return `grep ${pattern}`;
     return toolName;
-  }
+  }],
+]);
+
+function inferCommandFromToolInput(
+  toolName: string,
+  input: Record<string, unknown>,
+): string | undefined {
+  const normalized = toolName.trim().toLowerCase();
+  const baseName = normalized.slice(Math.max(normalized.lastIndexOf('/'), normalized.lastIndexOf(':')) + 1);
+  const formatter = TOOL_COMMAND_FORMATTERS.get(baseName);
+  if (formatter) return formatter(input, toolName);
   return toolName || undefined;
 }
 
@@ -246,8 +274,12 @@ export class ClaudeAgentProvider implements AgentProvider {
     const permissionMode = resolveClaudePermissionMode(options.permissionMode, envPermMode);
 
     const pendingEvents: ProviderEvent[] = [];
-    const toolStartMsById = new Map<string, number>();
-    const toolContextById = new Map<string, { name: string; input: Record<string, unknown> }>();
+    // One entry per in-flight tool call, removed when its result arrives.
+    const pendingToolById = new Map<string, {
+      name: string;
+      input: Record<string, unknown>;
+      startedMs: number;
+    }>();
     const canUseTool: CanUseTool = async (toolName, input, permissionOptions) => {
       const blockReason = getDangerousBashCommandBlockReason(toolName, input, process.env);
       if (blockReason) {
@@ -262,19 +294,19 @@ export class ClaudeAgentProvider implements AgentProvider {
           hooks: [
             async (input: HookInput) => {
               if (input.hook_event_name !== 'PreToolUse') return { continue: true };
-              toolStartMsById.set(input.tool_use_id, Date.now());
-              const toolInput = toRecord(input.tool_input);
-              toolContextById.set(input.tool_use_id, {
-                name: input.tool_name,
-                input: toolInput,
-              });
-              pendingEvents.push({
-                type: 'tool_use',
+              const toolUseEvent = {
+                type: 'tool_use' as const,
                 name: input.tool_name,
-                input: toolInput,
+                input: toRecord(input.tool_input),
                 id: input.tool_use_id,
                 timestamp: nowIso(),
+              };
+              pendingToolById.set(input.tool_use_id, {
+                name: toolUseEvent.name,
+                input: toolUseEvent.input,
+                startedMs: performance.now(),
               });
+              pendingEvents.push(toolUseEvent);
               return { continue: true };
             },
           ],
@@ -285,9 +317,9 @@ export class ClaudeAgentProvider implements AgentProvider {
           hooks: [
             async (input: HookInput) => {
               if (input.hook_event_name !== 'PostToolUse') return { continue: true };
-              const startedMs = toolStartMsById.get(input.tool_use_id);
-              const durationMs = startedMs ? Date.now() - startedMs : null;
-              const context = toolContextById.get(input.tool_use_id);
+              const context = pendingToolById.get(input.tool_use_id);
+              pendingToolById.delete(input.tool_use_id);
+              const durationMs = context ? Math.round(performance.now() - context.startedMs) : null;
               const toolName = context?.name ?? input.tool_name;
               const toolInput = context?.input ?? toRecord(input.tool_input);
               const rawText = safeCompactString(input.tool_response);
@@ -296,7 +328,6 @@ export class ClaudeAgentProvider implements AgentProvider {
                 command: inferCommandFromToolInput(toolName, toolInput),
                 exitCode: parseExitCodeFromToolOutput(rawText),
               });
-              toolContextById.delete(input.tool_use_id);
               pendingEvents.push({
                 type: 'tool_result',
                 toolUseId: input.tool_use_id,
@@ -321,9 +352,9 @@ export class ClaudeAgentProvider implements AgentProvider {
           hooks: [
             async (input: HookInput) => {
               if (input.hook_event_name !== 'PostToolUseFailure') return { continue: true };
-              const startedMs = toolStartMsById.get(input.tool_use_id);
-              const durationMs = startedMs ? Date.now() - startedMs : null;
-              const context = toolContextById.get(input.tool_use_id);
+              const context = pendingToolById.get(input.tool_use_id);
+              pendingToolById.delete(input.tool_use_id);
+              const durationMs = context ? Math.round(performance.now() - context.startedMs) : null;
               const toolName = context?.name ?? input.tool_name;
               const toolInput = context?.input ?? toRecord(input.tool_input);
               const rawText = input.error;
@@ -332,7 +363,6 @@ export class ClaudeAgentProvider implements AgentProvider {
                 command: inferCommandFromToolInput(toolName, toolInput),
                 forceStructuredSummary: true,
               });
-              toolContextById.delete(input.tool_use_id);
               pendingEvents.push({
                 type: 'tool_result',
                 toolUseId: input.tool_use_id,
@@ -375,7 +405,19 @@ export class ClaudeAgentProvider implements AgentProvider {
     const q = query({ prompt, options: sdkOptions });
 
     for await (const msg of q as AsyncIterable<SDKMessage>) {
-      while (pendingEvents.length) yield pendingEvents.shift()!;
+      yield* drainPendingEvents(pendingEvents);
+      // The SDK may emit synthetic `user` messages for tool results. Since we
+      // separately capture tool outcomes via hooks, suppress these to avoid
+      // duplicating tool results in the output stream. Checked before the
+      // timestamp is built since these are dropped on every tool call.
+      if (
+        msg.type === 'user'
+        && msg.parent_tool_use_id !== null
+        && (msg as SDKUserMessage).tool_use_result !== undefined
+      ) {
+        continue;
+      }
+
       const ts = nowIso();
       if (msg.type === 'assistant') {
         yield { type: 'assistant', content: extractTextFromAssistantMessage(msg.message), timestamp: ts };
@@ -383,12 +425,6 @@ export class ClaudeAgentProvider implements AgentProvider {
       }
 
       if (msg.type === 'user') {
-        // The SDK may emit synthetic `user` messages for tool results. Since we
-        // separately capture tool outcomes via hooks, suppress these to avoid
-        // duplicating tool results in the output stream.
-        if (msg.parent_tool_use_id !== null && (msg as SDKUserMessage).tool_use_result !== undefined) {
-          continue;
-        }
         yield { type: 'user', content: extractTextFromMessageParam(msg.message), timestamp: ts };
         continue;
       }
@@ -442,9 +478,9 @@ export class ClaudeAgentProvider implements AgentProvider {
       }
 
       yield { type: 'system', content: `[sdk] ${JSON.stringify(msg)}`, timestamp: ts, sessionId: (msg as { session_id?: string }).session_id ?? null };
-      while (pendingEvents.length) yield pendingEvents.shift()!;
+      yield* drainPendingEvents(pendingEvents);
     }
 
-    while (pendingEvents.length) yield pendingEvents.shift()!;
+    yield* drainPendingEvents(pendingEvents);
   }
 }
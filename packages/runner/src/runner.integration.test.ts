@@ -202,6 +202,117 @@ describe('runner integration', () => {
     expect(prompt.indexOf('CLAUDE SENTINEL')).toBeLessThan(prompt.indexOf('PHASE PROMPT SENTINEL'));
   });
 
+  it('strips terminal escape sequences from tool output before logging it', async () => {
+    const tmp = await makeTempDir('jeeves-runner-ansi-');
+    const workflowsDir = path.join(tmp, 'workflows');
+    const promptsDir = path.join(tmp, 'prompts');
+    const stateDir = path.join(tmp, 'state');
+    const cwd = path.join(tmp, 'work');
+
+    await fs.mkdir(workflowsDir, { recursive: true });
+    await fs.mkdir(promptsDir, { recursive: true });
+    await fs.mkdir(cwd, { recursive: true });
+
+    await fs.writeFile(
+      path.join(workflowsDir, 'ansi-fixture.yaml'),
+      [
+        'workflow:',
+        '  name: ansi-fixture',
+        '  version: 1',
+        '  start: only_phase',
+        'phases:',
+        '  only_phase:',
+        '    type: execute',
+        '    prompt: only.prompt.md',
+        '    transitions: []',
+      ].join('\n') + '\n',
+      'utf-8',
+    );
+    await fs.writeFile(path.join(promptsDir, 'only.prompt.md'), 'PHASE PROMPT', 'utf-8');
+
+    const provider: AgentProvider = {
+      name: 'ansi-provider',
+      async *run(): AsyncIterable<ProviderEvent> {
+        yield { type: 'tool_result', toolUseId: 'tool-1', content: '\u001b[1;32mPASS\u001b[0m src/a.test.ts' };
+        yield { type: 'result', content: 'ok' };
+      },
+    };
+    const result = await runSinglePhaseOnce({
+      provider,
+      workflowName: 'ansi-fixture',
+      phaseName: 'only_phase',
+      workflowsDir,
+      promptsDir,
+      stateDir,
+      cwd,
+    });
+
+    expect(result.success).toBe(true);
+    const log = await fs.readFile(path.join(stateDir, 'last-run.log'), 'utf-8');
+    expect(log).toContain('[TOOL_RESULT] tool-1 PASS src/a.test.ts');
+    expect(log).not.toContain('\u001b');
+  });
+
+  it('writes every buffered log line to last-run.log in order before returning', async () => {
+    const tmp = await makeTempDir('jeeves-runner-log-flush-');
+    const workflowsDir = path.join(tmp, 'workflows');
+    const promptsDir = path.join(tmp, 'prompts');
+    const stateDir = path.join(tmp, 'state');
+    const cwd = path.join(tmp, 'work');
+
+    await fs.mkdir(workflowsDir, { recursive: true });
+    await fs.mkdir(promptsDir, { recursive: true });
+    await fs.mkdir(cwd, { recursive: true });
+
+    await fs.writeFile(
+      path.join(workflowsDir, 'flush-fixture.yaml'),
+      [
+        'workflow:',
+        '  name: flush-fixture',
+        '  version: 1',
+        '  start: only_phase',
+        'phases:',
+        '  only_phase:',
+        '    type: execute',
+        '    prompt: only.prompt.md',
+        '    transitions: []',
+      ].join('\n') + '\n',
+      'utf-8',
+    );
+    await fs.writeFile(path.join(promptsDir, 'only.prompt.md'), 'PHASE PROMPT', 'utf-8');
+
+    // Messages arrive faster than the 250ms flush interval, so most of them
+    // sit behind the flush timer until the phase ends.
+    const provider: AgentProvider = {
+      name: 'trickle-provider',
+      async *run(): AsyncIterable<ProviderEvent> {
+        for (let i = 0; i < 6; i += 1) {
+          yield { type: 'assistant', content: `MSG-${i}` };
+          await new Promise((resolve) => setTimeout(resolve, 20));
+        }
+        yield { type: 'result', content: 'ok' };
+      },
+    };
+    const result = await runSinglePhaseOnce({
+      provider,
+      workflowName: 'flush-fixture',
+      phaseName: 'only_phase',
+      workflowsDir,
+      promptsDir,
+      stateDir,
+      cwd,
+    });
+
+    expect(result.success).toBe(true);
+    const log = await fs.readFile(path.join(stateDir, 'last-run.log'), 'utf-8');
+    const messages = log
+      .split('\n')
+      .map((line) => /\[ASSISTANT\] (MSG-\d+)$/.exec(line)?.[1])
+      .filter((msg): msg is string => Boolean(msg));
+    expect(messages).toEqual(['MSG-0', 'MSG-1', 'MSG-2', 'MSG-3', 'MSG-4', 'MSG-5']);
+    expect(log).toContain('[RESULT] ok');
+  });
+
   it('uses active-context snapshot as primary handoff and excludes retired trajectory by default', async () => {
     const tmp = await makeTempDir('jeeves-runner-active-context-');
     const workflowsDir = path.join(tmp, 'workflows');
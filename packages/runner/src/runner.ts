@@ -1,7 +1,8 @@
 import fs from 'node:fs/promises';
 import path from 'node:path';
+import { performance } from 'node:perf_hooks';
 
-import { loadWorkflowByName, resolvePromptPath, WorkflowEngine } from '@jeeves/core';
+import { loadWorkflowByName, resolvePromptPath, stripTerminalControls, WorkflowEngine } from '@jeeves/core';
 import {
   appendRunLogLine,
   dbPathForDataDir,
@@ -20,6 +21,10 @@ import { SdkOutputWriterV1 } from './outputWriter.js';
 const PREPENDED_INSTRUCTION_FILES = ['AGENTS.md', 'CLAUDE.md'] as const;
 const MAX_PROMPT_MEMORY_ENTRIES = 500;
 const ACTIVE_CONTEXT_FILE = 'active-context.json';
+// last-run.log is buffered and appended at most every LOG_FLUSH_INTERVAL_MS
+// (or once LOG_FLUSH_MAX_CHARS accumulate) instead of one write per line.
+const LOG_FLUSH_INTERVAL_MS = 250;
+const LOG_FLUSH_MAX_CHARS = 16 * 1024;
 
 function memoryScopeRank(scope: MemoryEntry['scope']): number {
   if (scope === 'working_set') return 1;
@@ -604,9 +609,51 @@ export async function runPhaseOnce(params: RunPhaseParams): Promise<{ success: b
     outputPath: params.outputPath,
     dbContext: runDbContext,
   });
-  const logLine = async (line: string): Promise<void> => {
-    const stamped = `${new Date().toISOString()} ${line}`;
-    await logStream.appendFile(`${stamped}\n`, 'utf-8');
+  let pendingLogText = '';
+  // Monotonic, like the sdk-output throttle.
+  let lastLogFlushMs = Number.NEGATIVE_INFINITY;
+  let logFlushTimer: NodeJS.Timeout | null = null;
+  let logWriteChain: Promise<void> = Promise.resolve();
+  // A failed append is held here until the next awaited flush rethrows it, so
+  // text flushed from the timer is never dropped without an error.
+  let logWriteError: unknown = null;
+  const queueLogFlush = (): void => {
+    if (logFlushTimer) {
+      clearTimeout(logFlushTimer);
+      logFlushTimer = null;
+    }
+    if (pendingLogText) {
+      const text = pendingLogText;
+      pendingLogText = '';
+      lastLogFlushMs = performance.now();
+      // Chain appends so concurrent flushes (timer vs. size threshold) keep order.
+      logWriteChain = logWriteChain.then(() =>
+        logStream.appendFile(text, 'utf-8').catch((err: unknown) => {
+          logWriteError ??= err;
+        }),
+      );
+    }
+  };
+  const flushLog = async (): Promise<void> => {
+    queueLogFlush();
+    await logWriteChain;
+    if (logWriteError !== null) {
+      const err = logWriteError;
+      logWriteError = null;
+      throw err;
+    }
+  };
+  const logLine = async (line: string, timestamp?: string): Promise<void> => {
+    const stamped = `${timestamp ?? new Date().toISOString()} ${stripTerminalControls(line)}`;
+    pendingLogText += `${stamped}\n`;
+    if (pendingLogText.length >= LOG_FLUSH_MAX_CHARS || performance.now() - lastLogFlushMs >= LOG_FLUSH_INTERVAL_MS) {
+      await flushLog();
+    } else if (!logFlushTimer) {
+      logFlushTimer = setTimeout(() => {
+        logFlushTimer = null;
+        queueLogFlush();
+      }, LOG_FLUSH_INTERVAL_MS);
+    }
     if (runDbContext) {
       appendRunLogLine({
         dataDir: runDbContext.dataDir,
@@ -677,22 +724,40 @@ export async function runPhaseOnce(params: RunPhaseParams): Promise<{ success: b
     for await (const evt of params.provider.run(prompt, { cwd: params.cwd, ...(mcpServers ? { mcpServers } : {}), ...(params.permissionMode ? { permissionMode: params.permissionMode } : {}) })) {
       writer.addProviderEvent(evt);
 
-      if (evt.type === 'assistant' || evt.type === 'user' || evt.type === 'result') {
-        await logLine(`[${evt.type.toUpperCase()}] ${evt.content}`);
-      } else if (evt.type === 'system') {
-        await logLine(`[SYSTEM${evt.subtype ? `:${evt.subtype}` : ''}] ${evt.content}`);
-        if (evt.sessionId !== undefined) writer.setSessionId(evt.sessionId);
-      } else if (evt.type === 'tool_use') {
-        await logLine(`[TOOL] ${evt.name} ${JSON.stringify(evt.input)}`);
-      } else if (evt.type === 'tool_result') {
-        await logLine(`[TOOL_RESULT] ${evt.toolUseId} ${evt.content}`);
-      } else if (evt.type === 'usage') {
-        const u = evt.usage;
-        const costStr = u.total_cost_usd != null ? ` cost=$${u.total_cost_usd.toFixed(4)}` : '';
-        await logLine(`[USAGE] in=${u.input_tokens} out=${u.output_tokens}${costStr}`);
+      // Cases are ordered by how often they occur in a typical run.
+      switch (evt.type) {
+        case 'tool_use':
+          await logLine(`[TOOL] ${evt.name} ${JSON.stringify(evt.input)}`, evt.timestamp);
+          break;
+        case 'tool_result':
+          await logLine(`[TOOL_RESULT] ${evt.toolUseId} ${evt.content}`, evt.timestamp);
+          break;
+        case 'assistant':
+          await logLine(`[ASSISTANT] ${evt.content}`, evt.timestamp);
+          break;
+        case 'system':
+          await logLine(`[SYSTEM${evt.subtype ? `:${evt.subtype}` : ''}] ${evt.content}`, evt.timestamp);
+          if (evt.sessionId !== undefined) writer.setSessionId(evt.sessionId);
+          break;
+        case 'user':
+          await logLine(`[USER] ${evt.content}`, evt.timestamp);
+          break;
+        case 'result':
+          await logLine(`[RESULT] ${evt.content}`, evt.timestamp);
+          break;
+        case 'usage': {
+          const u = evt.usage;
+          const costStr = u.total_cost_usd != null ? ` cost=$${u.total_cost_usd.toFixed(4)}` : '';
+          await logLine(`[USAGE] in=${u.input_tokens} out=${u.output_tokens}${costStr}`, evt.timestamp);
+          break;
+        }
       }
 
-      await writer.writeIncremental();
+      // Keep draining the provider stream while the snapshot is written; the
+      // forced writes below wait for any in-flight write first.
+      void writer.writeIncremental().catch((err) =>
+        logLine(`[WARN] sdk-output write failed: ${err instanceof Error ? err.message : String(err)}`).catch(() => void 0),
+      );
     }
 
     writer.finalize(true);
@@ -708,7 +773,11 @@ export async function runPhaseOnce(params: RunPhaseParams): Promise<{ success: b
     await markEnded(params.stateDir, false);
     return { success: false };
   } finally {
-    await logStream.close();
+    try {
+      await flushLog();
+    } finally {
+      await logStream.close();
+    }
   }
 }
 
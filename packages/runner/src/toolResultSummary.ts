@@ -59,11 +59,11 @@ function parsePossibleLineNumber(raw: string): number | null {
 }
 
 function collectStructuredSummary(params: {
-  rawText: string;
+  lines: readonly string[];
   command?: string;
   exitCode?: number | null;
 }): ToolResponseStructuredSummary {
-  const lines = splitNonEmptyLines(params.rawText);
+  const { lines } = params;
   const errorSignature = lines.find((line) => ERROR_LINE_PATTERN.test(line)) ?? null;
 
   const pathCandidates: string[] = [];
@@ -108,8 +108,7 @@ function collectStructuredSummary(params: {
   return structured;
 }
 
-function collectHighlights(rawText: string): string[] {
-  const lines = splitNonEmptyLines(rawText);
+function collectHighlights(lines: readonly string[]): string[] {
   if (lines.length === 0) return [];
 
   const important: string[] = [];
@@ -191,10 +190,11 @@ export function summarizeToolResponse(options: ToolSummaryOptions): ToolSummaryR
       ? null
       : undefined;
 
+  // Split once; the structured summary and highlights reuse the same lines.
   const lines = splitNonEmptyLines(rawText);
   const isNoisy = rawText.length > maxChars || lines.length > NOISY_OUTPUT_LINE_THRESHOLD;
   const shouldExtract = options.forceStructuredSummary || isNoisy;
-  const structuredSummary = collectStructuredSummary({ rawText, command, exitCode });
+  const structuredSummary = collectStructuredSummary({ lines, command, exitCode });
 
   if (!shouldExtract) {
     const truncated = truncateText(rawText, maxChars);
@@ -216,7 +216,7 @@ export function summarizeToolResponse(options: ToolSummaryOptions): ToolSummaryR
 
   const extractive = buildExtractiveSummaryText({
     structured: structuredSummary,
-    highlights: collectHighlights(rawText),
+    highlights: collectHighlights(lines),
   });
   const candidateSummary = extractive || rawText;
   const truncated = truncateText(candidateSummary, maxChars);
@@ -552,23 +552,35 @@ function upsertIssueStateNormalized(
 }
 
 export function readIssueFromDb(stateDir: string): JsonRecord | null {
+  const payload = readIssuePayloadFromDb(stateDir);
+  if (!payload) return null;
+  return parseJsonRecord(payload);
+}
+
+/** Returns the stored issue.json payload text without parsing it. */
+export function readIssuePayloadFromDb(stateDir: string): string | null {
   const dataDir = deriveDataDirFromStateDir(stateDir);
   const normalizedStateDir = path.resolve(stateDir);
   return withDb(dataDir, (db) => {
     const row = db
       .prepare('SELECT payload_json FROM issue_state_payload WHERE state_dir = ?')
       .get(normalizedStateDir) as { payload_json: string } | undefined;
-    const payload = row?.payload_json;
-    if (!payload) return null;
-    return parseJsonRecord(payload);
+    return row?.payload_json || null;
   });
 }
 
-export function writeIssueToDb(stateDir: string, data: JsonRecord): void {
+/**
+ * Stores issue state. Connections run with synchronous = NORMAL, which keeps
+ * the database consistent but may lose the latest commits on power loss;
+ * pass `durable` for writes that must survive that (e.g. the state a run
+ * ends in), which syncs the WAL on commit for this write only.
+ */
+export function writeIssueToDb(stateDir: string, data: JsonRecord, options?: { durable?: boolean }): void {
   const dataDir = deriveDataDirFromStateDir(stateDir);
   const updatedAt = nowIso();
 
   withDb(dataDir, (db) => {
+    if (options?.durable) db.pragma('synchronous = FULL');
     upsertIssueStateNormalized(db, stateDir, data, updatedAt);
   });
 }
@@ -1185,6 +1197,14 @@ export function listPromptsFromDb(dataDir: string): StoredPrompt[] {
   });
 }
 
+/** Prompt ids only; reads the primary-key index without loading any content. */
+export function listPromptIdsFromDb(dataDir: string): string[] {
+  return withDb(dataDir, (db) => {
+    const rows = db.prepare('SELECT id FROM prompts ORDER BY id ASC').all() as { id: string }[];
+    return rows.map((row) => row.id);
+  });
+}
+
 export function readPromptFromDb(dataDir: string, id: string): StoredPrompt | null {
   return withDb(dataDir, (db) => {
     const row = db
@@ -1226,6 +1246,14 @@ export function listWorkflowsFromDb(dataDir: string): StoredWorkflow[] {
   });
 }
 
+/** Workflow names only; reads the primary-key index without loading any YAML. */
+export function listWorkflowNamesFromDb(dataDir: string): string[] {
+  return withDb(dataDir, (db) => {
+    const rows = db.prepare('SELECT name FROM workflows ORDER BY name ASC').all() as { name: string }[];
+    return rows.map((row) => row.name);
+  });
+}
+
 export function readWorkflowFromDb(dataDir: string, name: string): StoredWorkflow | null {
   return withDb(dataDir, (db) => {
     const row = db
@@ -1594,6 +1622,38 @@ export function appendRunLogLine(params: {
   });
 }
 
+/**
+ * Appends several lines to one run log stream in a single transaction and
+ * returns their ids in order. Used when callers have a batch ready, so the
+ * lines share one connection and one commit.
+ */
+export function appendRunLogLines(params: {
+  dataDir: string;
+  runId: string;
+  scope: string;
+  stream: string;
+  lines: readonly string[];
+  taskId?: string;
+  ts?: string;
+}): number[] {
+  if (params.lines.length === 0) return [];
+  const ts = params.ts ?? nowIso();
+  return withDb(params.dataDir, (db) => {
+    const insertStmt = db.prepare(
+      `
+      INSERT INTO run_log_lines (run_id, scope, task_id, stream, ts, line)
+      VALUES (?, ?, ?, ?, ?, ?)
+      `,
+    );
+    const tx = db.transaction((lines: readonly string[]) =>
+      lines.map((line) =>
+        Number(insertStmt.run(params.runId, params.scope, params.taskId ?? '', params.stream, ts, line).lastInsertRowid),
+      ),
+    );
+    return tx(params.lines);
+  });
+}
+
 export function listRunLogLines(params: {
   dataDir: string;
   runId: string;
@@ -1648,6 +1708,86 @@ export function listRunLogLines(params: {
   });
 }
 
+/**
+ * Returns the last `limit` lines of a run log stream in ascending id order.
+ * Walks the lookup index backwards, so cost scales with `limit` rather than
+ * with the total number of lines logged for the run.
+ */
+export function listRunLogTail(params: {
+  dataDir: string;
+  runId: string;
+  scope: string;
+  stream: string;
+  taskId?: string;
+  limit: number;
+}): RunLogLine[] {
+  const limit = Number.isInteger(params.limit) ? Math.max(1, Number(params.limit)) : 1000;
+  return withDb(params.dataDir, (db) => {
+    const rows = db
+      .prepare(
+        `
+        SELECT id, run_id, scope, task_id, stream, ts, line
+        FROM run_log_lines
+        WHERE run_id = ?
+          AND scope = ?
+          AND stream = ?
+          AND task_id = ?
+        ORDER BY id DESC
+        LIMIT ?
+        `,
+      )
+      .all(
+        params.runId,
+        params.scope,
+        params.stream,
+        params.taskId ?? '',
+        limit,
+      ) as {
+      id: number;
+      run_id: string;
+      scope: string;
+      task_id: string;
+      stream: string;
+      ts: string;
+      line: string;
+    }[];
+    return rows.reverse().map((row) => ({
+      id: row.id,
+      runId: row.run_id,
+      scope: row.scope,
+      taskId: row.task_id,
+      stream: row.stream,
+      ts: row.ts,
+      line: row.line,
+    }));
+  });
+}
+
+/** Highest log line id recorded for a run log stream, or 0 when there are none. */
+export function readLatestRunLogLineId(params: {
+  dataDir: string;
+  runId: string;
+  scope: string;
+  stream: string;
+  taskId?: string;
+}): number {
+  return withDb(params.dataDir, (db) => {
+    const row = db
+      .prepare(
+        `
+        SELECT MAX(id) AS id
+        FROM run_log_lines
+        WHERE run_id = ?
+          AND scope = ?
+          AND stream = ?
+          AND task_id = ?
+        `,
+      )
+      .get(params.runId, params.scope, params.stream, params.taskId ?? '') as { id: number | null } | undefined;
+    return row?.id ?? 0;
+  });
+}
+
 export function appendRunSdkEvent(params: {
   dataDir: string;
   runId: string;
@@ -1725,6 +1865,29 @@ export function listRunSdkEvents(params: {
   });
 }
 
+/** Highest SDK event id recorded for a run scope, or 0 when there are none. */
+export function readLatestRunSdkEventId(params: {
+  dataDir: string;
+  runId: string;
+  scope: string;
+  taskId?: string;
+}): number {
+  return withDb(params.dataDir, (db) => {
+    const row = db
+      .prepare(
+        `
+        SELECT MAX(id) AS id
+        FROM run_sdk_events
+        WHERE run_id = ?
+          AND scope = ?
+          AND task_id = ?
+        `,
+      )
+      .get(params.runId, params.scope, params.taskId ?? '') as { id: number | null } | undefined;
+    return row?.id ?? 0;
+  });
+}
+
 export function upsertRunArtifact(params: {
   dataDir: string;
   runId: string;
@@ -0,0 +1,77 @@
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+
+import { describe, expect, it } from 'vitest';
+
+import {
+  appendRunLogLine,
+  appendRunLogLines,
+  appendRunSdkEvent,
+  listRunLogLines,
+  listRunLogTail,
+  readLatestRunLogLineId,
+  readLatestRunSdkEventId,
+  upsertRunSession,
+} from './index.js';
+
+describe('state-db run log lines', () => {
+  it('returns the newest lines in ascending order from listRunLogTail', async () => {
+    const dataDir = await fs.mkdtemp(path.join(os.tmpdir(), 'jeeves-state-db-run-log-tail-'));
+    const stateDir = path.join(dataDir, 'issues', 'acme', 'rocket', '7');
+    upsertRunSession({ dataDir, runId: 'run-1', stateDir });
+
+    for (let i = 0; i < 10; i += 1) {
+      appendRunLogLine({ dataDir, runId: 'run-1', scope: 'canonical', stream: 'log', line: `line ${i}` });
+    }
+    appendRunLogLine({ dataDir, runId: 'run-1', scope: 'viewer', stream: 'log', line: 'other scope' });
+
+    const tail = listRunLogTail({ dataDir, runId: 'run-1', scope: 'canonical', stream: 'log', limit: 3 });
+    expect(tail.map((row) => row.line)).toEqual(['line 7', 'line 8', 'line 9']);
+
+    const all = listRunLogLines({ dataDir, runId: 'run-1', scope: 'canonical', stream: 'log' });
+    expect(tail[tail.length - 1]?.id).toBe(all[all.length - 1]?.id);
+  });
+
+  it('reports the latest sdk event id for a run scope', async () => {
+    const dataDir = await fs.mkdtemp(path.join(os.tmpdir(), 'jeeves-state-db-sdk-latest-'));
+    const stateDir = path.join(dataDir, 'issues', 'acme', 'rocket', '8');
+    upsertRunSession({ dataDir, runId: 'run-2', stateDir });
+
+    expect(readLatestRunSdkEventId({ dataDir, runId: 'run-2', scope: 'canonical' })).toBe(0);
+
+    appendRunSdkEvent({ dataDir, runId: 'run-2', scope: 'canonical', event: { event: 'sdk-init', data: {} } });
+    const lastId = appendRunSdkEvent({ dataDir, runId: 'run-2', scope: 'canonical', event: { event: 'sdk-message', data: {} } });
+    appendRunSdkEvent({ dataDir, runId: 'run-2', scope: 'worker', taskId: 'T1', event: { event: 'sdk-init', data: {} } });
+
+    expect(readLatestRunSdkEventId({ dataDir, runId: 'run-2', scope: 'canonical' })).toBe(lastId);
+  });
+
+  it('reports the latest log line id for a run log stream', async () => {
+    const dataDir = await fs.mkdtemp(path.join(os.tmpdir(), 'jeeves-state-db-log-latest-'));
+    const stateDir = path.join(dataDir, 'issues', 'acme', 'rocket', '9');
+    upsertRunSession({ dataDir, runId: 'run-3', stateDir });
+
+    expect(readLatestRunLogLineId({ dataDir, runId: 'run-3', scope: 'canonical', stream: 'log' })).toBe(0);
+
+    appendRunLogLine({ dataDir, runId: 'run-3', scope: 'canonical', stream: 'log', line: 'first' });
+    const lastId = appendRunLogLine({ dataDir, runId: 'run-3', scope: 'canonical', stream: 'log', line: 'second' });
+    appendRunLogLine({ dataDir, runId: 'run-3', scope: 'canonical', stream: 'sdk', line: 'other stream' });
+    appendRunLogLine({ dataDir, runId: 'run-3', scope: 'worker', taskId: 'T1', stream: 'log', line: 'worker' });
+
+    expect(readLatestRunLogLineId({ dataDir, runId: 'run-3', scope: 'canonical', stream: 'log' })).toBe(lastId);
+  });
+
+  it('appends a batch of log lines in order with appendRunLogLines', async () => {
+    const dataDir = await fs.mkdtemp(path.join(os.tmpdir(), 'jeeves-state-db-log-batch-'));
+    const stateDir = path.join(dataDir, 'issues', 'acme', 'rocket', '10');
+    upsertRunSession({ dataDir, runId: 'run-4', stateDir });
+
+    expect(appendRunLogLines({ dataDir, runId: 'run-4', scope: 'viewer', stream: 'log', lines: [] })).toEqual([]);
+    const ids = appendRunLogLines({ dataDir, runId: 'run-4', scope: 'viewer', stream: 'log', lines: ['a', 'b', 'c'] });
+
+    const rows = listRunLogLines({ dataDir, runId: 'run-4', scope: 'viewer', stream: 'log' });
+    expect(rows.map((row) => row.line)).toEqual(['a', 'b', 'c']);
+    expect(rows.map((row) => row.id)).toEqual(ids);
+  });
+});